@@ -7,9 +7,41 @@ This package contains the core components for the multi-agent refactoring system
 - tools: Utility functions for file operations and test execution
 """
 
-from .agents import auditor_agent, fixer_agent, judge_agent
-from .graph import app
-from .tools import read_file, write_file, run_pytest
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Same names as _LAZY_EXPORTS, for linters and IDEs
+    from .agents import auditor_agent, fixer_agent, judge_agent
+    from .graph import app
+    from .tools import read_file, write_file, run_pytest
+
+# Re-exports are loaded on first access (PEP 562). Importing the agents pulls
+# in the LLM client and LangGraph and needs MISTRAL_API_KEY, which code that
+# only imports src.tools or src.utils should not pay for.
+_LAZY_EXPORTS = {
+    "auditor_agent": ".agents",
+    "fixer_agent": ".agents",
+    "judge_agent": ".agents",
+    "app": ".graph",
+    "read_file": ".tools",
+    "write_file": ".tools",
+    "run_pytest": ".tools",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "auditor_agent",
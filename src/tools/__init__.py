@@ -91,9 +91,14 @@ from .parser import (
     ClassInfo,
     ImportInfo,
     CodeMetrics,
+    compute_metrics,
+    functions_from_tree,
     extract_functions,
     extract_classes,
-    get_imports
+    get_imports,
+    batch_metrics,
+    parse_files_async,
+    clear_ast_cache
 )
 
 # ============================================================================
@@ -103,7 +108,8 @@ from .function_fixer import (
     FunctionFixer,
     FixResult,
     FixedIssue,
-    fix_code
+    fix_code,
+    fix_codes
 )
 
 
@@ -153,15 +159,21 @@ __all__ = [
     'ClassInfo',
     'ImportInfo',
     'CodeMetrics',
+    'compute_metrics',
+    'functions_from_tree',
     'extract_functions',
     'extract_classes',
     'get_imports',
+    'batch_metrics',
+    'parse_files_async',
+    'clear_ast_cache',
     
     # Code Fixing
     'FunctionFixer',
     'FixResult',
     'FixedIssue',
     'fix_code',
+    'fix_codes',
 ]
 
 
@@ -13,6 +13,7 @@ Features:
 """
 
 import subprocess
+import time
 import json
 import re
 from pathlib import Path
@@ -24,7 +25,7 @@ from .exceptions import AnalysisError, SecurityError
 from .sandbox import SandboxManager
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """Represents a single Pylint issue.
     
@@ -168,7 +169,7 @@ class PylintAnalyzer:
             >>> if result.success:
             ...     print(f"Quality score: {result.score}/10")
         """
-        start_time = datetime.now()
+        start = time.perf_counter()
         
         try:
             # Validate path
@@ -195,7 +196,7 @@ class PylintAnalyzer:
             score, issues = self._parse_output(raw_output)
             
             # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start
             
             # Build metadata
             metadata = {
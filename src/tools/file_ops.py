@@ -11,18 +11,137 @@ Features:
 - Structured error reporting
 """
 
+import heapq
 import os
 import shutil
+import stat
+import time
 from pathlib import Path
 from typing import Union, Optional, Tuple, List
 from dataclasses import dataclass, field
-from datetime import datetime
 
 from .exceptions import FileOpError, SecurityError
 from .sandbox import SandboxManager
 
 
-@dataclass
+def _format_timestamp(ts: Optional[float]) -> Optional[str]:
+    """Format a POSIX timestamp as a local ISO-8601 string (seconds precision).
+    
+    Args:
+        ts: Timestamp as returned by os.stat(), or None
+        
+    Returns:
+        Formatted string, or None if no timestamp was given
+    """
+    if ts is None:
+        return None
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+
+
+def _path_str(path: Union[str, Path]) -> str:
+    """Convert a path argument to str, skipping the conversion for str input.
+    
+    Args:
+        path: Path as given by the caller
+        
+    Returns:
+        String form of the path
+    """
+    if isinstance(path, str):
+        return path
+    if isinstance(path, os.PathLike):
+        return os.fspath(path)
+    return str(path)
+
+
+def _walk_python_files(directory: str) -> List[str]:
+    """Recursively collect .py files under a directory, in sorted order.
+    
+    Each directory is sorted on its own and the per-directory results are
+    merged with heapq.merge, so there is no global sort over every path.
+    DirEntry type checks reuse the readdir data instead of stat-ing.
+    Symlinked directories are not descended into (same as Path.rglob).
+    A missing directory, or a path that is not a directory, yields an empty
+    list (same as Path.rglob and os.walk).
+    
+    Args:
+        directory: Directory to search
+        
+    Returns:
+        Sorted list of absolute file path strings
+    """
+    files = []
+    subdirs = []
+    try:
+        it = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return files
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                files.append(entry.path)
+    files.sort()
+    
+    nested = []
+    for subdir in subdirs:
+        try:
+            nested.append(_walk_python_files(subdir))
+        except PermissionError:
+            continue
+    
+    if not nested:
+        return files
+    return list(heapq.merge(files, *nested))
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write a whole buffer to a file descriptor (os.write may be partial).
+    
+    Args:
+        fd: Open file descriptor
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _link_tmpfile(target: str, data: bytes) -> bool:
+    """Create a new file through an unnamed O_TMPFILE inode (Linux only).
+    
+    The data is written to an inode with no directory entry, which is then
+    linked to target via /proc/self/fd. No temp name is ever visible and
+    there is nothing to clean up if the write fails. linkat() cannot replace
+    an existing file, so this is only used when target does not exist.
+    
+    Args:
+        target: Absolute path of the file to create
+        data: File content
+        
+    Returns:
+        True if the file was created, False if O_TMPFILE is unavailable
+        (non-Linux, unsupported filesystem) or target appeared meanwhile;
+        the caller then falls back to temp file + rename.
+    """
+    if not hasattr(os, "O_TMPFILE"):
+        return False
+    try:
+        fd = os.open(os.path.dirname(target), os.O_WRONLY | os.O_TMPFILE, 0o666)
+    except OSError:
+        return False
+    try:
+        _write_all(fd, data)
+        os.link(f"/proc/self/fd/{fd}", target, follow_symlinks=True)
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True)
 class FileOperationResult:
     """Result of a file operation.
     
@@ -35,6 +154,10 @@ class FileOperationResult:
         filepath: The file that was operated on
         error: Error message if operation failed
         metadata: Additional information (size, encoding, timestamp, etc.)
+    
+    Timestamps are stored raw in metadata (``modified_time_ts``,
+    ``created_time_ts``) and only formatted when the matching property
+    is accessed.
     """
     success: bool
     content: Optional[str] = None
@@ -42,6 +165,16 @@ class FileOperationResult:
     error: Optional[str] = None
     metadata: dict = field(default_factory=dict)
     
+    @property
+    def modified_time(self) -> Optional[str]:
+        """Modification time as ISO-8601 string, formatted on demand."""
+        return _format_timestamp(self.metadata.get("modified_time_ts"))
+    
+    @property
+    def created_time(self) -> Optional[str]:
+        """Creation (ctime) as ISO-8601 string, formatted on demand."""
+        return _format_timestamp(self.metadata.get("created_time_ts"))
+    
     def to_dict(self) -> dict:
         """Convert result to dictionary for logging.
         
@@ -71,6 +204,8 @@ class FileOperations:
         ...     print(result.content)
     """
     
+    __slots__ = ("_sandbox",)
+    
     def __init__(self, sandbox: SandboxManager):
         """Initialize FileOperations.
         
@@ -105,21 +240,22 @@ class FileOperations:
         try:
             # Validate path
             safe_path = self._sandbox.validate_path(filepath)
+            safe_str = os.fspath(safe_path)
             
             # Check file exists
             if not safe_path.exists():
                 return FileOperationResult(
                     success=False,
-                    filepath=str(safe_path),
-                    error=f"File not found: {safe_path}"
+                    filepath=safe_str,
+                    error=f"File not found: {safe_str}"
                 )
             
             # Check it's a file (not directory)
             if not safe_path.is_file():
                 return FileOperationResult(
                     success=False,
-                    filepath=str(safe_path),
-                    error=f"Not a file: {safe_path}"
+                    filepath=safe_str,
+                    error=f"Not a file: {safe_str}"
                 )
             
             # Try to read with specified encoding
@@ -132,31 +268,31 @@ class FileOperations:
                 actual_encoding = "latin-1"
             
             # Get file metadata
-            stat = safe_path.stat()
+            st = safe_path.stat()
             metadata = {
-                "size_bytes": stat.st_size,
+                "size_bytes": st.st_size,
                 "encoding": actual_encoding,
                 "line_count": content.count('\n') + 1,
-                "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat()
+                "modified_time_ts": st.st_mtime
             }
             
             return FileOperationResult(
                 success=True,
                 content=content,
-                filepath=str(safe_path),
+                filepath=safe_str,
                 metadata=metadata
             )
             
         except SecurityError as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Security violation: {e.message}"
             )
         except Exception as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Unexpected error: {type(e).__name__}: {str(e)}"
             )
     
@@ -170,6 +306,9 @@ class FileOperations:
         3. Writes to temporary file
         4. Renames temp file to target (atomic operation)
         
+        On Linux, new files are instead written to an unnamed O_TMPFILE
+        inode and linked into place, so no temp file is ever visible.
+        
         Args:
             filepath: Path to file (relative to sandbox or absolute within sandbox)
             content: Content to write
@@ -187,50 +326,64 @@ class FileOperations:
         try:
             # Validate path
             safe_path = self._sandbox.validate_path(filepath)
+            safe_str = os.fspath(safe_path)
             
             # Create parent directories if needed
             safe_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Create backup if file exists
             backup_path = None
-            if create_backup and safe_path.exists():
-                backup_result = self.create_backup(safe_path)
+            target_exists = os.path.exists(safe_str)
+            if create_backup and target_exists:
+                backup_result = self.create_backup(safe_str)
                 if backup_result.success:
                     backup_path = backup_result.metadata.get("backup_path")
             
-            # Write to temporary file first (atomic operation)
-            temp_path = safe_path.with_suffix(safe_path.suffix + ".tmp")
-            temp_path.write_text(content, encoding=encoding)
+            # Encode once: the same buffer gives size, line count and
+            # the bytes to write (line count assumes an ASCII-compatible
+            # encoding, which covers utf-8 and latin-1)
+            data = content.encode(encoding)
+            
+            # New files go through an unnamed O_TMPFILE inode where the
+            # platform supports it; otherwise write a temp file first and
+            # rename it over the target (atomic operation).
+            if target_exists or not _link_tmpfile(safe_str, data):
+                # Plain string concat: with_suffix() re-parses the path.
+                temp_str = f"{safe_str}.tmp.{os.getpid()}"
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+                fd = os.open(temp_str, flags, 0o666)
+                try:
+                    _write_all(fd, data)
+                finally:
+                    os.close(fd)
+                
+                # Atomic rename
+                os.replace(temp_str, safe_str)
             
-            # Atomic rename
-            temp_path.replace(safe_path)
-            
-            # Get file metadata
-            stat = safe_path.stat()
             metadata = {
-                "size_bytes": stat.st_size,
+                "size_bytes": len(data),
                 "encoding": encoding,
-                "line_count": content.count('\n') + 1,
+                "line_count": content.count("\n") + 1,
                 "backup_created": backup_path is not None,
                 "backup_path": backup_path
             }
             
             return FileOperationResult(
                 success=True,
-                filepath=str(safe_path),
+                filepath=safe_str,
                 metadata=metadata
             )
             
         except SecurityError as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Security violation: {e.message}"
             )
         except Exception as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Write failed: {type(e).__name__}: {str(e)}"
             )
     
@@ -253,27 +406,28 @@ class FileOperations:
         try:
             # Validate path
             safe_path = self._sandbox.validate_path(filepath)
+            safe_str = os.fspath(safe_path)
             
             # Check file exists
             if not safe_path.exists():
                 return FileOperationResult(
                     success=False,
-                    filepath=str(safe_path),
+                    filepath=safe_str,
                     error="Cannot backup: file does not exist"
                 )
             
             # Generate backup filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = safe_path.with_suffix(f"{safe_path.suffix}.bak.{timestamp}")
+            timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+            backup_str = f"{safe_str}.bak.{timestamp}"
             
             # Copy file
-            shutil.copy2(safe_path, backup_path)
+            shutil.copy2(safe_str, backup_str)
             
             return FileOperationResult(
                 success=True,
-                filepath=str(safe_path),
+                filepath=safe_str,
                 metadata={
-                    "backup_path": str(backup_path),
+                    "backup_path": backup_str,
                     "timestamp": timestamp
                 }
             )
@@ -281,7 +435,7 @@ class FileOperations:
         except Exception as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Backup failed: {type(e).__name__}: {str(e)}"
             )
     
@@ -306,7 +460,7 @@ class FileOperations:
                 search_dir = self._sandbox.sandbox_root
             
             # Find all .py files
-            python_files = sorted([str(f) for f in search_dir.rglob("*.py")])
+            python_files = _walk_python_files(os.fspath(search_dir))
             
             return FileOperationResult(
                 success=True,
@@ -335,8 +489,9 @@ class FileOperations:
         """
         try:
             safe_path = self._sandbox.validate_path(filepath)
-            return safe_path.exists() and safe_path.is_file()
-        except:
+            # One stat call instead of exists() + is_file()
+            return stat.S_ISREG(os.stat(safe_path).st_mode)
+        except (SecurityError, ValueError, OSError):
             return False
     
     def get_file_info(self, filepath: Union[str, Path]) -> FileOperationResult:
@@ -351,40 +506,43 @@ class FileOperations:
         Example:
             >>> result = file_ops.get_file_info("code.py")
             >>> print(result.metadata)
-            {'size_bytes': 1234, 'modified': '2026-01-09T14:30:22', ...}
+            {'size_bytes': 1234, 'modified_time_ts': 1767969022.0, ...}
+            >>> print(result.modified_time)
+            2026-01-09T14:30:22
         """
         try:
             safe_path = self._sandbox.validate_path(filepath)
+            safe_str = os.fspath(safe_path)
             
             if not safe_path.exists():
                 return FileOperationResult(
                     success=False,
-                    filepath=str(safe_path),
+                    filepath=safe_str,
                     error="File not found"
                 )
             
-            stat = safe_path.stat()
+            st = safe_path.stat()
             metadata = {
                 "exists": True,
                 "is_file": safe_path.is_file(),
                 "is_directory": safe_path.is_dir(),
-                "size_bytes": stat.st_size,
-                "created_time": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "size_bytes": st.st_size,
+                "created_time_ts": st.st_ctime,
+                "modified_time_ts": st.st_mtime,
                 "extension": safe_path.suffix,
                 "filename": safe_path.name
             }
             
             return FileOperationResult(
                 success=True,
-                filepath=str(safe_path),
+                filepath=safe_str,
                 metadata=metadata
             )
             
         except Exception as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Failed to get file info: {str(e)}"
             )
     
@@ -401,11 +559,12 @@ class FileOperations:
         """
         try:
             safe_path = self._sandbox.validate_path(filepath)
+            safe_str = os.fspath(safe_path)
             
             if not safe_path.exists():
                 return FileOperationResult(
                     success=False,
-                    filepath=str(safe_path),
+                    filepath=safe_str,
                     error="File not found"
                 )
             
@@ -421,7 +580,7 @@ class FileOperations:
             
             return FileOperationResult(
                 success=True,
-                filepath=str(safe_path),
+                filepath=safe_str,
                 metadata={
                     "deleted": True,
                     "backup_created": backup_path is not None,
@@ -432,12 +591,34 @@ class FileOperations:
         except Exception as e:
             return FileOperationResult(
                 success=False,
-                filepath=str(filepath),
+                filepath=_path_str(filepath),
                 error=f"Delete failed: {str(e)}"
             )
 
 
 # Module-level convenience functions (use global sandbox)
+
+# FileOperations reused across convenience calls. Single slot: callers
+# almost always pass the same (global) sandbox, and holding one instance
+# avoids keeping every sandbox ever seen alive.
+_cached_file_ops: Optional[FileOperations] = None
+
+
+def _file_ops_for(sandbox: SandboxManager) -> FileOperations:
+    """Return a FileOperations bound to sandbox, reusing the last one.
+    
+    Args:
+        sandbox: SandboxManager the operations should use
+        
+    Returns:
+        FileOperations instance for that sandbox
+    """
+    global _cached_file_ops
+    file_ops = _cached_file_ops
+    if file_ops is None or file_ops._sandbox is not sandbox:
+        file_ops = _cached_file_ops = FileOperations(sandbox)
+    return file_ops
+
 def read_file(filepath: Union[str, Path], 
               sandbox: Optional[SandboxManager] = None) -> FileOperationResult:
     """Convenience function to read a file.
@@ -451,7 +632,7 @@ def read_file(filepath: Union[str, Path],
     """
     from .sandbox import get_sandbox
     sandbox = sandbox or get_sandbox()
-    file_ops = FileOperations(sandbox)
+    file_ops = _file_ops_for(sandbox)
     return file_ops.read_file(filepath)
 
 
@@ -469,7 +650,7 @@ def write_file(filepath: Union[str, Path], content: str,
     """
     from .sandbox import get_sandbox
     sandbox = sandbox or get_sandbox()
-    file_ops = FileOperations(sandbox)
+    file_ops = _file_ops_for(sandbox)
     return file_ops.write_file(filepath, content)
 
 
@@ -486,6 +667,6 @@ def list_python_files(directory: Optional[Union[str, Path]] = None,
     """
     from .sandbox import get_sandbox
     sandbox = sandbox or get_sandbox()
-    file_ops = FileOperations(sandbox)
+    file_ops = _file_ops_for(sandbox)
     result = file_ops.list_python_files(directory)
     return result.metadata.get("files", []) if result.success else []
@@ -14,17 +14,148 @@ The fixer applies structured transformations without executing code.
 """
 
 import ast
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache, partial
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
 from .exceptions import ParsingError, FileOpError
-from .parser import CodeParser, FunctionInfo, ClassInfo
+from .parser import CodeParser, FunctionInfo, ClassInfo, _has_docstring, _parse_cached
 from .file_ops import FileOperations
 from .sandbox import SandboxManager
 
 
-@dataclass
+# Patterns used by the fix methods, compiled once at import time
+_UNUSED_IMPORT_RE = re.compile(r"Unused import (\w+)")
+_FROM_IMPORT_RE = re.compile(r"from (.+) import (.+)")
+_FUNC_CALL_RE = re.compile(r'(\w+)\((.+)\)')
+_INVALID_NAME_RE = re.compile(r'Invalid name "(\w+)"')
+
+
+@lru_cache(maxsize=256)
+def _names_pattern(names: Tuple[str, ...]) -> re.Pattern:
+    """Return a compiled pattern matching any of the identifiers as a whole word."""
+    return re.compile(r'\b(' + '|'.join(map(re.escape, names)) + r')\b')
+
+
+def _rename_match(mapping: Dict[str, str], found: set, match: re.Match) -> str:
+    """re.sub callback: record the matched name and return its replacement."""
+    name = match.group(1)
+    found.add(name)
+    return mapping[name]
+
+
+@lru_cache(maxsize=16)
+def _indent(n: int) -> str:
+    """Return an indentation string of n spaces, shared between fixes."""
+    return ' ' * n
+
+
+@lru_cache(maxsize=64)
+def _docstring(kind: str, indent: str) -> str:
+    """Return the docstring template for a 'function' or 'class' at an indent."""
+    if kind == "function":
+        return f'{indent}"""\n{indent}Function description.\n{indent}\n{indent}Returns:\n{indent}    None\n{indent}"""'
+    return f'{indent}"""Class description."""'
+
+
+@lru_cache(maxsize=4096)
+def _snake_case(name: str) -> str:
+    """Convert CamelCase to snake_case in a single scan.
+    
+    An underscore goes before an ASCII capital that either follows a
+    lowercase letter or digit, or starts a capitalised word ('HTTPServer'
+    -> 'http_server'). Equivalent to the former pair of substitutions
+    ``(.)([A-Z][a-z]+)`` and ``([a-z0-9])([A-Z])`` followed by lower().
+    """
+    out = []
+    last = len(name) - 1
+    prev_lower = False  # previous char is [a-z0-9]
+    for i, c in enumerate(name):
+        if 'A' <= c <= 'Z':
+            if prev_lower or (0 < i < last and 'a' <= name[i + 1] <= 'z'):
+                out.append('_')
+            prev_lower = False
+        else:
+            prev_lower = 'a' <= c <= 'z' or '0' <= c <= '9'
+        out.append(c)
+    return ''.join(out).lower()
+
+
+# Statement keywords _classify recognises, by first word
+_LINE_KINDS = {
+    "def": "def",
+    "async": "async_def",
+    "class": "class",
+    "import": "import",
+    "from": "from_import",
+}
+_KIND_PREFIXES = ("def ", "async def ", "class ", "import ", "from ")
+
+
+def _classify(line: str) -> Tuple[str, int]:
+    """Classify a source line by its leading keyword.
+    
+    Args:
+        line: One line of source, without terminator
+        
+    Returns:
+        (kind, indent) where kind is one of 'def', 'async_def', 'class',
+        'import', 'from_import' or 'other', and indent is the number of
+        leading whitespace characters
+    """
+    stripped = line.lstrip()
+    indent = len(line) - len(stripped)
+    if stripped.startswith(_KIND_PREFIXES):
+        return _LINE_KINDS[stripped[:stripped.index(" ")]], indent
+    return "other", indent
+
+
+def _line_ending(line: str) -> str:
+    """Return the terminator a source line carries ('' for the last line)."""
+    if line.endswith("\r\n"):
+        return "\r\n"
+    if line.endswith("\n"):
+        return "\n"
+    return ""
+
+
+def _first_line(node: ast.AST) -> int:
+    """Return the 1-based line a statement starts on, decorators included."""
+    decorators = getattr(node, "decorator_list", None)
+    if decorators:
+        return min(node.lineno, min(dec.lineno for dec in decorators))
+    return node.lineno
+
+
+class _DefIndex(ast.NodeVisitor):
+    """Index function and class definitions by the line of their keyword.
+    
+    ``kinds`` maps the 1-based ``def``/``class`` line to ``(kind, node)``,
+    where kind is ``"function"`` or ``"class"``. Decorated, async and
+    multi-line definitions are all keyed by their keyword line, which is
+    the line Pylint reports.
+    """
+    
+    def __init__(self):
+        self.kinds: Dict[int, Tuple[str, ast.AST]] = {}
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.kinds[node.lineno] = ("function", node)
+        self.generic_visit(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.kinds[node.lineno] = ("class", node)
+        self.generic_visit(node)
+
+
+@dataclass(slots=True)
 class FixedIssue:
     """Represents a successfully applied fix."""
     issue_type: str           # Issue symbol (e.g., 'missing-docstring')
@@ -35,7 +166,7 @@ class FixedIssue:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FixResult:
     """Result of attempting to fix code."""
     success: bool
@@ -61,6 +192,97 @@ class FixResult:
         }
 
 
+class LineEditLog:
+    """Deferred line edits over an immutable list of source lines.
+    
+    Fix methods record edits against *original* line indices instead of
+    mutating the line list, so one fix never shifts the line numbers the
+    next issue refers to. Recording an edit is O(1); ``materialize`` builds
+    the result in a single pass over the original lines.
+    
+    Lines keep their own terminators, so CRLF sources round-trip unchanged.
+    Edit text is given without a terminator (and with ``\\n`` between
+    lines if it spans several); the log applies the source's newline.
+    
+    Example:
+        >>> log = LineEditLog(["import os\\n", "x = 1\\n"])
+        >>> log.delete(0)
+        >>> log.insert_after(1, "y = 2")
+        >>> log.materialize()
+        ['x = 1\\n', 'y = 2\\n']
+    """
+    
+    __slots__ = ("_lines", "_newline", "_replaced", "_deleted", "_before", "_after")
+    
+    def __init__(self, lines: List[str]):
+        self._lines = lines
+        self._newline = (_line_ending(lines[0]) if lines else "") or "\n"
+        self._replaced: Dict[int, str] = {}
+        self._deleted = set()
+        self._before: Dict[int, List[str]] = {}
+        self._after: Dict[int, List[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._lines)
+    
+    def current(self, line_num: int) -> Optional[str]:
+        """Return the line as edited so far (without terminator), or None if deleted."""
+        if line_num in self._deleted:
+            return None
+        if line_num in self._replaced:
+            return self._replaced[line_num]
+        line = self._lines[line_num]
+        ending = _line_ending(line)
+        return line[:-len(ending)] if ending else line
+    
+    def replace(self, line_num: int, text: str) -> None:
+        """Replace an original line (text may span several lines)."""
+        self._replaced[line_num] = text
+    
+    def delete(self, line_num: int) -> None:
+        """Drop an original line."""
+        self._deleted.add(line_num)
+    
+    def insert_before(self, line_num: int, text: str) -> None:
+        """Insert text immediately before an original line."""
+        self._before.setdefault(line_num, []).append(text)
+    
+    def insert_after(self, line_num: int, text: str) -> None:
+        """Insert text immediately after an original line."""
+        self._after.setdefault(line_num, []).append(text)
+    
+    def materialize(self) -> List[str]:
+        """Apply all recorded edits and return the resulting lines."""
+        newline = self._newline
+        replaced = self._replaced
+        deleted = self._deleted
+        before = self._before
+        after = self._after
+        
+        def terminated(text: str) -> str:
+            if newline != "\n":
+                text = text.replace("\n", newline)
+            return text + newline
+        
+        out: List[str] = []
+        for i, line in enumerate(self._lines):
+            if i in before:
+                out.extend(terminated(text) for text in before[i])
+            if i not in deleted:
+                if i in replaced:
+                    ending = _line_ending(line)
+                    text = replaced[i]
+                    if newline != "\n":
+                        text = text.replace("\n", newline)
+                    line = text + ending
+                if i in after and not _line_ending(line):
+                    line += newline  # last line gains a terminator
+                out.append(line)
+            if i in after:
+                out.extend(terminated(text) for text in after[i])
+        return out
+
+
 class FunctionFixer:
     """Automated code fixer using AST transformations.
     
@@ -82,6 +304,19 @@ class FunctionFixer:
         ...     print(result.fixed_code)
     """
     
+    # Fix handlers by issue symbol, in order of priority (non-conflicting first)
+    _FIX_METHODS = {
+        "missing-docstring": "_fix_missing_docstring",
+        "unused-import": "_fix_unused_import",
+        "line-too-long": "_fix_line_too_long",
+        "invalid-name": "_fix_invalid_names",
+        "too-many-arguments": "_fix_too_many_arguments",
+    }
+    
+    # Symbols whose handler receives all of their issues in one call and
+    # returns a list of fixes
+    _BATCH_SYMBOLS = frozenset({"invalid-name"})
+    
     def __init__(self, sandbox: SandboxManager):
         """Initialize FunctionFixer.
         
@@ -89,16 +324,25 @@ class FunctionFixer:
             sandbox: SandboxManager instance for path validation
         """
         self._sandbox = sandbox
-        self._parser = CodeParser(sandbox)
-        self._file_ops = FileOperations(sandbox)
         
-        # Common docstring templates
-        self._docstring_templates = {
-            "function": '    """Function description.\n    \n    Returns:\n        None\n    """',
-            "class": '    """Class description."""',
+        # symbol -> (priority, bound fix method), resolved once per fixer
+        self._fix_dispatch = {
+            symbol: (priority, getattr(self, method_name))
+            for priority, (symbol, method_name) in enumerate(self._FIX_METHODS.items())
         }
     
-    def fix_code(self, code: str, issues: List[Dict[str, Any]]) -> FixResult:
+    @cached_property
+    def _parser(self) -> CodeParser:
+        """CodeParser for this sandbox, built on first use."""
+        return CodeParser(self._sandbox)
+    
+    @cached_property
+    def _file_ops(self) -> FileOperations:
+        """FileOperations for this sandbox, built on first use."""
+        return FileOperations(self._sandbox)
+    
+    def fix_code(self, code: str, issues: List[Dict[str, Any]],
+                 tree: Optional[ast.Module] = None) -> FixResult:
         """Fix code based on Pylint issues.
         
         This method:
@@ -110,13 +354,16 @@ class FunctionFixer:
         Args:
             code: Source code as string
             issues: List of Pylint issues with 'symbol', 'line', 'message'
+            tree: Already-parsed AST of ``code``, if the caller has one
+                (skips the parse; it is not checked against ``code``)
             
         Returns:
             FixResult with fixed code and applied fixes list
         """
         try:
-            # Validate code is parseable
-            tree = ast.parse(code)
+            # Validate code is parseable (shares CodeParser's AST cache)
+            if tree is None:
+                tree = _parse_cached(code)
         except SyntaxError as e:
             return FixResult(
                 success=False,
@@ -124,34 +371,54 @@ class FunctionFixer:
                 metadata={"error_type": "syntax_error", "line": e.lineno}
             )
         
-        # Group issues by type for batch processing
-        issues_by_type = self._group_issues_by_type(issues)
+        # Lines keep their terminators; StringIO splits on "\n" only, so line
+        # numbers match Pylint's even when the source contains form feeds
+        edits = LineEditLog(io.StringIO(code).readlines())
         
-        lines = code.split('\n')
+        # Definition nodes by the line their 'def'/'class' keyword is on
+        index = _DefIndex()
+        index.visit(tree)
+        defs = index.kinds
         fixes_applied: List[FixedIssue] = []
         
-        # Apply fixes in order of priority (non-conflicting first)
-        fix_methods = [
-            ("missing-docstring", self._fix_missing_docstring),
-            ("unused-import", self._fix_unused_import),
-            ("line-too-long", self._fix_line_too_long),
-            ("invalid-name", self._fix_invalid_name),
-            ("too-many-arguments", self._fix_too_many_arguments),
-        ]
-        
-        for issue_type, fix_method in fix_methods:
-            if issue_type in issues_by_type:
-                for issue in issues_by_type[issue_type]:
-                    try:
-                        fixed_issue = fix_method(lines, issue)
-                        if fixed_issue:
-                            fixes_applied.append(fixed_issue)
-                    except Exception as e:
-                        # Log failure but continue with other fixes
-                        continue
-        
-        # Reconstruct code
-        fixed_code = '\n'.join(lines)
+        # Single pass over issues: keep the fixable ones tagged with their
+        # handler's priority, then apply in priority order. The sort is
+        # stable, so issues of the same type keep their reported order.
+        # No bottom-up ordering is needed: handlers record edits against
+        # original line numbers, and every FixedIssue.line_number refers
+        # to the source as passed in.
+        # Batch handlers get one work item carrying all of their issues.
+        dispatch = self._fix_dispatch
+        batch_symbols = self._BATCH_SYMBOLS
+        work = []
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        for issue in issues:
+            symbol = issue.get("symbol", "unknown")
+            entry = dispatch.get(symbol)
+            if entry is None:
+                continue
+            if symbol in batch_symbols:
+                if symbol not in batches:
+                    batches[symbol] = []
+                    work.append((entry[0], entry[1], batches[symbol]))
+                batches[symbol].append(issue)
+            else:
+                work.append((entry[0], entry[1], issue))
+        work.sort(key=itemgetter(0))
+        
+        for _, fix_method, payload in work:
+            try:
+                fixed = fix_method(edits, payload, defs)
+                if isinstance(fixed, list):
+                    fixes_applied.extend(fixed)
+                elif fixed:
+                    fixes_applied.append(fixed)
+            except Exception as e:
+                # Log failure but continue with other fixes
+                continue
+        
+        # Reconstruct code in one pass over the original lines
+        fixed_code = ''.join(edits.materialize())
         
         return FixResult(
             success=True,
@@ -164,75 +431,57 @@ class FunctionFixer:
             }
         )
     
-    def _group_issues_by_type(self, issues: List[Dict[str, Any]]) -> Dict[str, List[Dict]]:
-        """Group issues by their symbol/type.
-        
-        Args:
-            issues: List of issue dictionaries
-            
-        Returns:
-            Dictionary mapping issue type to list of issues
-        """
-        grouped = {}
-        for issue in issues:
-            issue_type = issue.get("symbol", "unknown")
-            if issue_type not in grouped:
-                grouped[issue_type] = []
-            grouped[issue_type].append(issue)
-        return grouped
-    
-    def _fix_missing_docstring(self, lines: List[str], issue: Dict) -> Optional[FixedIssue]:
+    def _fix_missing_docstring(self, edits: LineEditLog, issue: Dict,
+                               defs: Dict[int, Tuple[str, ast.AST]]) -> Optional[FixedIssue]:
         """Fix missing docstring by adding one.
         
         Adds appropriate docstring template to functions and classes.
         
         Args:
-            lines: Code lines (mutable)
+            edits: Pending line edits, indexed by original line number
             issue: Issue dictionary with 'line', 'message'
+            defs: (kind, node) of each definition, keyed by its line
             
         Returns:
             FixedIssue if successful, None otherwise
         """
         line_num = issue.get("line", 0) - 1  # Convert to 0-indexed
-        if line_num < 0 or line_num >= len(lines):
+        if line_num < 0 or line_num >= len(edits):
             return None
         
-        line = lines[line_num]
+        line = edits.current(line_num)
+        if line is None:
+            return None
         
         # Check if this is a function or class definition
-        if line.strip().startswith("def "):
-            docstring_type = "function"
-        elif line.strip().startswith("class "):
-            docstring_type = "class"
-        else:
+        kind_node = defs.get(line_num + 1)
+        if kind_node is None:
+            return None
+        docstring_type, node = kind_node
+        if _has_docstring(node):
+            return None  # Already has docstring
+        
+        # The docstring goes right above the first body statement, which
+        # also handles multi-line signatures. A body on the signature line
+        # ('def f(): pass') cannot take one without restructuring.
+        first = node.body[0]
+        body_line = _first_line(first) - 1
+        if body_line <= line_num:
             return None
         
-        # Calculate indentation
-        indent = len(line) - len(line.lstrip())
-        indent_str = ' ' * indent
-        
-        # Get template and adjust indentation
-        template = self._docstring_templates[docstring_type]
-        if docstring_type == "function":
-            docstring = f'{indent_str}"""\n{indent_str}Function description.\n{indent_str}\n{indent_str}Returns:\n{indent_str}    None\n{indent_str}"""'
+        # Indent like the body
+        body_text = edits.current(body_line)
+        if body_text is None:
+            indent_str = _indent(first.col_offset)
         else:
-            docstring = f'{indent_str}"""Class description."""'
+            indent_str = body_text[:_classify(body_text)[1]]
         
-        # Find the colon and next line (where docstring should go)
-        colon_idx = line.find(":")
-        if colon_idx == -1:
-            return None
-        
-        # Check if next line is already a docstring
-        if line_num + 1 < len(lines):
-            next_line = lines[line_num + 1].strip()
-            if next_line.startswith('"""') or next_line.startswith("'''"):
-                return None  # Already has docstring
+        # Get template at the body's indentation
+        docstring = _docstring(docstring_type, indent_str)
         
         original_code = line
         
-        # Insert docstring on next line
-        lines.insert(line_num + 1, docstring)
+        edits.insert_before(body_line, docstring)
         
         return FixedIssue(
             issue_type="missing-docstring",
@@ -243,49 +492,55 @@ class FunctionFixer:
             description=f"Added docstring to {docstring_type}"
         )
     
-    def _fix_unused_import(self, lines: List[str], issue: Dict) -> Optional[FixedIssue]:
+    def _fix_unused_import(self, edits: LineEditLog, issue: Dict,
+                           defs: Dict[int, Tuple[str, ast.AST]]) -> Optional[FixedIssue]:
         """Remove unused import statements.
         
         Removes entire import line or specific import from 'from X import Y'.
         
         Args:
-            lines: Code lines (mutable)
+            edits: Pending line edits, indexed by original line number
             issue: Issue dictionary with 'line', 'message'
+            defs: (kind, node) of each definition, keyed by its line
             
         Returns:
             FixedIssue if successful, None otherwise
         """
         line_num = issue.get("line", 0) - 1  # Convert to 0-indexed
-        if line_num < 0 or line_num >= len(lines):
+        if line_num < 0 or line_num >= len(edits):
             return None
         
-        line = lines[line_num]
+        line = edits.current(line_num)
+        if line is None:
+            return None
         original_code = line
         
         # Check if it's an import statement
-        if not (line.strip().startswith("import ") or line.strip().startswith("from ")):
+        kind, indent = _classify(line)
+        if kind != "import" and kind != "from_import":
             return None
         
         # Extract unused module name from message
         # Message format: "Unused import module_name"
-        unused_match = re.search(r"Unused import (\w+)", issue.get("message", ""))
+        unused_match = _UNUSED_IMPORT_RE.search(issue.get("message", ""))
         if not unused_match:
             return None
         
         unused_name = unused_match.group(1)
         
         # Handle "from X import Y" statements
-        if "from " in line and " import " in line:
+        if kind == "from_import" and " import " in line:
             # Parse and rebuild without the unused import
             # For simplicity, if only one import, remove whole line
-            import_match = re.search(r"from .+ import (.+)", line)
+            import_match = _FROM_IMPORT_RE.search(line)
             if import_match:
-                imports_str = import_match.group(1)
+                module = import_match.group(1).strip()
+                imports_str = import_match.group(2)
                 imports = [i.strip() for i in imports_str.split(",")]
                 
                 if len(imports) == 1:
                     # Remove entire line
-                    del lines[line_num]
+                    edits.delete(line_num)
                     return FixedIssue(
                         issue_type="unused-import",
                         line_number=line_num + 1,
@@ -295,14 +550,23 @@ class FunctionFixer:
                         description=f"Removed unused import: {unused_name}"
                     )
                 else:
-                    # Remove specific import from list
-                    imports = [i for i in imports if unused_name not in i]
-                    new_line = re.sub(
-                        r"from .+ import .+",
-                        f"from {import_match.group(0).split()[1]} import {', '.join(imports)}",
-                        line
-                    )
-                    lines[line_num] = new_line
+                    # Remove specific import from list (exact name match,
+                    # so 'json' does not also drop 'jsonschema')
+                    kept = [i for i in imports if i.split(' as ')[0].strip() != unused_name]
+                    if len(kept) == len(imports):
+                        return None
+                    if not kept:
+                        edits.delete(line_num)
+                        return FixedIssue(
+                            issue_type="unused-import",
+                            line_number=line_num + 1,
+                            original_code=original_code,
+                            fixed_code="",
+                            fix_type="deletion",
+                            description=f"Removed unused import: {unused_name}"
+                        )
+                    new_line = f"{line[:indent]}from {module} import {', '.join(kept)}"
+                    edits.replace(line_num, new_line)
                     return FixedIssue(
                         issue_type="unused-import",
                         line_number=line_num + 1,
@@ -313,7 +577,7 @@ class FunctionFixer:
                     )
         else:
             # Simple import statement
-            del lines[line_num]
+            edits.delete(line_num)
             return FixedIssue(
                 issue_type="unused-import",
                 line_number=line_num + 1,
@@ -325,145 +589,171 @@ class FunctionFixer:
         
         return None
     
-    def _fix_line_too_long(self, lines: List[str], issue: Dict) -> Optional[FixedIssue]:
+    def _fix_line_too_long(self, edits: LineEditLog, issue: Dict,
+                           defs: Dict[int, Tuple[str, ast.AST]]) -> Optional[FixedIssue]:
         """Break overly long lines into multiple lines.
         
         Applies intelligent line breaking for long lines while preserving syntax.
         
         Args:
-            lines: Code lines (mutable)
+            edits: Pending line edits, indexed by original line number
             issue: Issue dictionary with 'line'
+            defs: (kind, node) of each definition, keyed by its line
             
         Returns:
             FixedIssue if successful, None otherwise
         """
         line_num = issue.get("line", 0) - 1  # Convert to 0-indexed
-        if line_num < 0 or line_num >= len(lines):
+        if line_num < 0 or line_num >= len(edits):
             return None
         
-        line = lines[line_num]
+        line = edits.current(line_num)
+        if line is None:
+            return None
         original_code = line
         
-        # Only break very long lines (> 100 chars)
-        if len(line) <= 100:
+        # Only break very long lines (> 100 chars) holding a call. These
+        # checks are cheap, so they run before any regex work.
+        if len(line) <= 100 or "(" not in line or ")" not in line:
             return None
         
-        # Try to break at logical points
-        indent = len(line) - len(line.lstrip())
-        indent_str = ' ' * indent
-        
         # Strategy 1: Break at function call arguments
-        if "(" in line and ")" in line:
-            # Find function call
-            match = re.search(r'(\w+)\((.+)\)', line)
-            if match:
-                func_name = match.group(1)
-                args_str = match.group(2)
-                args = [arg.strip() for arg in args_str.split(",")]
+        match = _FUNC_CALL_RE.search(line)
+        if match:
+            func_name = match.group(1)
+            args_str = match.group(2)
+            args = [arg.strip() for arg in args_str.split(",")]
+            
+            if len(args) > 1:
+                # Rebuild with each arg on new line
+                indent_str = _indent(_classify(line)[1])
+                new_lines = [f"{indent_str}{func_name}("]
+                for i, arg in enumerate(args):
+                    if i < len(args) - 1:
+                        new_lines.append(f"{indent_str}    {arg},")
+                    else:
+                        new_lines.append(f"{indent_str}    {arg}")
+                new_lines[-1] += ")"
                 
-                if len(args) > 1:
-                    # Rebuild with each arg on new line
-                    new_lines = [f"{indent_str}{func_name}("]
-                    for i, arg in enumerate(args):
-                        if i < len(args) - 1:
-                            new_lines.append(f"{indent_str}    {arg},")
-                        else:
-                            new_lines.append(f"{indent_str}    {arg}")
-                    new_lines[-1] += ")"
-                    
-                    lines[line_num:line_num+1] = new_lines
-                    
-                    return FixedIssue(
-                        issue_type="line-too-long",
-                        line_number=line_num + 1,
-                        original_code=original_code,
-                        fixed_code='\n'.join(new_lines),
-                        fix_type="replacement",
-                        description="Broke long line into multiple lines"
-                    )
+                fixed_code = '\n'.join(new_lines)
+                edits.replace(line_num, fixed_code)
+                
+                return FixedIssue(
+                    issue_type="line-too-long",
+                    line_number=line_num + 1,
+                    original_code=original_code,
+                    fixed_code=fixed_code,
+                    fix_type="replacement",
+                    description="Broke long line into multiple lines"
+                )
         
         return None
     
-    def _fix_invalid_name(self, lines: List[str], issue: Dict) -> Optional[FixedIssue]:
+    def _fix_invalid_names(self, edits: LineEditLog, issues: List[Dict],
+                           defs: Dict[int, Tuple[str, ast.AST]]) -> List[FixedIssue]:
         """Fix invalid naming conventions.
         
-        Converts naming violations to PEP 8 compliant names.
+        Converts naming violations to PEP 8 compliant names. Renames are
+        grouped by line and each line is rewritten with a single
+        substitution, however many names on it need fixing.
         
         Args:
-            lines: Code lines (mutable)
-            issue: Issue dictionary with 'line', 'message'
+            edits: Pending line edits, indexed by original line number
+            issues: All invalid-name issue dictionaries with 'line', 'message'
+            defs: (kind, node) of each definition, keyed by its line
             
         Returns:
-            FixedIssue if successful, None otherwise
+            One FixedIssue per name actually renamed, in issue order
         """
-        line_num = issue.get("line", 0) - 1
-        if line_num < 0 or line_num >= len(lines):
-            return None
-        
-        line = lines[line_num]
-        original_code = line
-        
-        # Extract invalid name from message
-        # Message format: "Invalid name \"CamelCase\" (invalid-name)"
-        name_match = re.search(r'Invalid name "(\w+)"', issue.get("message", ""))
-        if not name_match:
-            return None
-        
-        invalid_name = name_match.group(1)
-        valid_name = self._to_snake_case(invalid_name)
-        
-        if valid_name == invalid_name:
-            return None  # Already valid
-        
-        # Replace the invalid name with valid one
-        new_line = re.sub(rf'\b{invalid_name}\b', valid_name, line)
-        
-        if new_line != line:
-            lines[line_num] = new_line
+        # line_num -> {invalid: valid}, plus the renames in reported order
+        by_line: Dict[int, Dict[str, str]] = {}
+        order: List[Tuple[int, str, str]] = []
+        for issue in issues:
+            line_num = issue.get("line", 0) - 1
+            if line_num < 0 or line_num >= len(edits):
+                continue
             
-            return FixedIssue(
-                issue_type="invalid-name",
-                line_number=line_num + 1,
-                original_code=original_code,
-                fixed_code=new_line,
-                fix_type="replacement",
-                description=f"Renamed {invalid_name} to {valid_name}"
-            )
-        
-        return None
+            # Extract invalid name from message
+            # Message format: "Invalid name \"CamelCase\" (invalid-name)"
+            name_match = _INVALID_NAME_RE.search(issue.get("message", ""))
+            if not name_match:
+                continue
+            
+            invalid_name = name_match.group(1)
+            valid_name = self._to_snake_case(invalid_name)
+            if valid_name == invalid_name:
+                continue  # Already valid
+            
+            mapping = by_line.setdefault(line_num, {})
+            if invalid_name not in mapping:
+                mapping[invalid_name] = valid_name
+                order.append((line_num, invalid_name, valid_name))
+        
+        # Rewrite each affected line once
+        rewritten: Dict[int, Tuple[str, str, set]] = {}
+        for line_num, mapping in by_line.items():
+            line = edits.current(line_num)
+            if line is None:
+                continue
+            found = set()
+            rename = partial(_rename_match, mapping, found)
+            new_line = _names_pattern(tuple(mapping)).sub(rename, line)
+            if new_line != line:
+                edits.replace(line_num, new_line)
+                rewritten[line_num] = (line, new_line, found)
+        
+        fixes: List[FixedIssue] = []
+        for line_num, invalid_name, valid_name in order:
+            if line_num not in rewritten:
+                continue
+            original_code, new_line, found = rewritten[line_num]
+            if invalid_name in found:
+                fixes.append(FixedIssue(
+                    issue_type="invalid-name",
+                    line_number=line_num + 1,
+                    original_code=original_code,
+                    fixed_code=new_line,
+                    fix_type="replacement",
+                    description=f"Renamed {invalid_name} to {valid_name}"
+                ))
+        return fixes
     
-    def _fix_too_many_arguments(self, lines: List[str], issue: Dict) -> Optional[FixedIssue]:
+    def _fix_too_many_arguments(self, edits: LineEditLog, issue: Dict,
+                                defs: Dict[int, Tuple[str, ast.AST]]) -> Optional[FixedIssue]:
         """Suggest refactoring for functions with too many arguments.
         
         Note: This is a structure suggestion, not an automatic fix.
         The fixer adds a comment suggesting the use of a config object.
         
         Args:
-            lines: Code lines (mutable)
+            edits: Pending line edits, indexed by original line number
             issue: Issue dictionary with 'line'
+            defs: (kind, node) of each definition, keyed by its line
             
         Returns:
             FixedIssue if successful, None otherwise
         """
         line_num = issue.get("line", 0) - 1
-        if line_num < 0 or line_num >= len(lines):
+        if line_num < 0 or line_num >= len(edits):
             return None
         
-        line = lines[line_num]
+        line = edits.current(line_num)
+        if line is None:
+            return None
         original_code = line
         
         # Only add comment suggestion for function definitions
-        if not line.strip().startswith("def "):
+        kind_node = defs.get(line_num + 1)
+        if kind_node is None or kind_node[0] != "function":
             return None
         
         # Extract indentation
-        indent = len(line) - len(line.lstrip())
-        indent_str = ' ' * indent
+        indent_str = line[:_classify(line)[1]]
         
-        # Add helpful comment before function
+        # Add helpful comment before function (above any decorators)
         comment = f'{indent_str}# Consider using a config object instead of many arguments'
         
-        lines.insert(line_num, comment)
+        edits.insert_before(_first_line(kind_node[1]) - 1, comment)
         
         return FixedIssue(
             issue_type="too-many-arguments",
@@ -484,20 +774,41 @@ class FunctionFixer:
         Returns:
             snake_case version of name
         """
-        # Insert underscore before uppercase letters
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        # Handle consecutive uppercase letters
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return _snake_case(name)
+
+
+# FunctionFixer reused across convenience calls. Single slot, as in
+# file_ops: the fixer holds its sandbox, so a per-sandbox mapping would keep
+# every sandbox alive (or, with weak values, drop the fixer right away).
+_cached_fixer: Optional[FunctionFixer] = None
+
+
+def _fixer_for(sandbox: SandboxManager) -> FunctionFixer:
+    """Return a FunctionFixer bound to sandbox, reusing the last one.
+    
+    Args:
+        sandbox: SandboxManager the fixer should use
+        
+    Returns:
+        FunctionFixer instance for that sandbox
+    """
+    global _cached_fixer
+    fixer = _cached_fixer
+    if fixer is None or fixer._sandbox is not sandbox:
+        fixer = _cached_fixer = FunctionFixer(sandbox)
+    return fixer
 
 
 # Module-level convenience function
-def fix_code(code: str, issues: List[Dict[str, Any]], sandbox: Optional[SandboxManager] = None) -> FixResult:
+def fix_code(code: str, issues: List[Dict[str, Any]], sandbox: Optional[SandboxManager] = None,
+             tree: Optional[ast.Module] = None) -> FixResult:
     """Convenience function to fix code.
     
     Args:
         code: Source code as string
         issues: List of Pylint issues
         sandbox: SandboxManager instance (uses global if not provided)
+        tree: Already-parsed AST of ``code`` (optional)
         
     Returns:
         FixResult with fixed code
@@ -513,5 +824,63 @@ def fix_code(code: str, issues: List[Dict[str, Any]], sandbox: Optional[SandboxM
         from . import get_sandbox
         sandbox = get_sandbox()
     
-    fixer = FunctionFixer(sandbox)
-    return fixer.fix_code(code, issues)
+    return _fixer_for(sandbox).fix_code(code, issues, tree)
+
+
+# Per-process fixer used by fix_codes workers, rebuilt only if the sandbox
+# root changes between tasks
+_worker_fixer: Optional[FunctionFixer] = None
+
+
+def _fix_in_worker(task: Tuple[str, str, List[Dict[str, Any]]]) -> FixResult:
+    """Fix one file's code inside a fix_codes worker process.
+    
+    Args:
+        task: (sandbox root, code, issues)
+        
+    Returns:
+        FixResult for the code
+    """
+    global _worker_fixer
+    root, code, issues = task
+    if _worker_fixer is None or str(_worker_fixer._sandbox.sandbox_root) != root:
+        _worker_fixer = FunctionFixer(SandboxManager(root))
+    return _worker_fixer.fix_code(code, issues)
+
+
+def fix_codes(files: List[Tuple[str, List[Dict[str, Any]]]],
+              sandbox: Optional[SandboxManager] = None,
+              max_workers: Optional[int] = None) -> List[FixResult]:
+    """Fix several files' code in parallel worker processes.
+    
+    Each (code, issues) pair is independent, so the batch is spread over a
+    process pool to get past the GIL for the parse and regex work. Only the
+    sandbox root path is sent to workers, which build their own
+    SandboxManager from it. Batches of one run in-process.
+    
+    Args:
+        files: (code, issues) pairs, one per file
+        sandbox: SandboxManager instance (uses global if not provided)
+        max_workers: Worker process count (defaults to os.cpu_count())
+        
+    Returns:
+        FixResult per input pair, in input order
+        
+    Example:
+        >>> results = fix_codes([(code_a, issues_a), (code_b, issues_b)])
+        >>> fixed = [r.fixed_code for r in results if r.success]
+    """
+    if sandbox is None:
+        from . import get_sandbox
+        sandbox = get_sandbox()
+    
+    if len(files) <= 1:
+        fixer = _fixer_for(sandbox)
+        return [fixer.fix_code(code, issues) for code, issues in files]
+    
+    root = str(sandbox.sandbox_root)
+    tasks = [(root, code, issues) for code, issues in files]
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    chunksize = max(1, min(8, len(tasks) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_fix_in_worker, tasks, chunksize=chunksize))
@@ -9,21 +9,258 @@ Features:
 - Extract class definitions
 - List imports
 - Detect syntax errors
-- Get code metrics
+- Get code metrics (one file, or many in parallel)
+- Async bulk parsing with overlapped file reads
+- In-process AST cache keyed by source hash
+- Optional on-disk AST cache (RSWARM_AST_CACHE=1)
+- Optional incremental re-parsing with tree-sitter
 """
 
 import ast
+import asyncio
+import hashlib
+import io
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Optional, List, Dict, Any
-from dataclasses import dataclass, field
+from typing import Union, Optional, List, Dict, Any, Set, Tuple
+from dataclasses import dataclass, field, fields
 
 from .exceptions import ParsingError, SecurityError
 from .sandbox import SandboxManager
 from .file_ops import read_file
 
+# Optional: tree-sitter re-parses only the edited region of a file. Without
+# it, incremental parsing falls back to a full (cached) ast parse.
+try:
+    import tree_sitter_python as _ts_python
+    from tree_sitter import Language as _TSLanguage, Parser as _TSParser
+except ImportError:
+    _ts_python = None
 
-@dataclass
-class FunctionInfo:
+
+# Parsed trees keyed by a digest of the source text. Shared by CodeParser
+# and FunctionFixer, so a file parsed by one is free for the other.
+# Cached trees are handed out as-is: callers must treat them as read-only.
+# Sources that failed to parse are cached too, as (exception type, args),
+# so repeated attempts on the same broken code fail without re-parsing.
+_AST_CACHE_MAXSIZE = 256
+# The dialect every tree is parsed in: the running interpreter's grammar,
+# without type comments. Spelled out so cached trees (in memory and on
+# disk, keyed by cache tag) all come from the same parser settings.
+_PARSE_OPTIONS = {"type_comments": False, "feature_version": sys.version_info[:2]}
+_ast_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+_ast_cache_lock = threading.Lock()
+
+
+class _AstCache:
+    """Persistent AST cache: one pickle per source digest.
+    
+    Enabled by setting ``RSWARM_AST_CACHE=1``; the directory defaults to
+    ``~/.cache/refactoring-swarm/ast`` and can be moved with
+    ``RSWARM_AST_CACHE_DIR``. Keys combine the SHA-256 of the source with
+    the interpreter's cache tag, since ast node classes differ between
+    Python versions. Edited files simply hash to a new key. Any read or
+    write problem is treated as a miss.
+    
+    Trees are stored with pickle: ``marshal`` only handles code objects
+    and builtin containers, and flattening nodes into tuples for it costs
+    more to rebuild than a fresh ``ast.parse``.
+    """
+    
+    _tag = sys.implementation.cache_tag or "unknown"
+    _format = f"p{pickle.HIGHEST_PROTOCOL}"
+    
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get("RSWARM_AST_CACHE") == "1"
+    
+    @staticmethod
+    def directory() -> Path:
+        override = os.environ.get("RSWARM_AST_CACHE_DIR")
+        if override:
+            return Path(override)
+        return Path.home() / ".cache" / "refactoring-swarm" / "ast"
+    
+    @classmethod
+    def _path(cls, data: bytes) -> Path:
+        return cls.directory() / f"{hashlib.sha256(data).hexdigest()}-{cls._tag}-{cls._format}.pkl"
+    
+    @classmethod
+    def load(cls, data: bytes) -> Optional[ast.Module]:
+        """Return the cached tree for this source, or None."""
+        try:
+            with open(cls._path(data), "rb") as f:
+                tree = pickle.loads(f.read())
+        except Exception:
+            return None
+        return tree if isinstance(tree, ast.Module) else None
+    
+    @classmethod
+    def store(cls, data: bytes, tree: ast.Module) -> None:
+        """Write a tree for this source (atomically; errors are ignored)."""
+        path = cls._path(data)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _parse_cached(content: Union[str, bytes], filename: str = "<unknown>") -> ast.Module:
+    """Parse source code, reusing the tree from a previous identical parse.
+    
+    Args:
+        content: Python source code, as text or as raw file bytes; bytes
+            are hashed and tokenized as-is, with no decode/encode, and
+            never share a cache entry with text
+        filename: Filename reported in SyntaxError messages
+        
+    Returns:
+        AST Module (shared, do not mutate)
+        
+    Raises:
+        SyntaxError: If the code cannot be parsed (re-raised from the cache
+            for source that already failed)
+    """
+    # Tagged by type: ast.parse honours a BOM or coding cookie in bytes but
+    # not in text, so the same bytes may parse differently in each form
+    if type(content) is bytes:
+        data = b"b:" + content
+    else:
+        data = b"s:" + content.encode("utf-8", "surrogatepass")
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with _ast_cache_lock:
+        entry = _ast_cache.get(key)
+        if entry is not None:
+            _ast_cache.move_to_end(key)
+    
+    if entry is not None:
+        if type(entry) is tuple:
+            # Known-bad source: raise a fresh error naming this filename
+            exc_type, msg, (_, lineno, offset, text, *end) = entry
+            raise exc_type(msg, (filename, lineno, offset, text, *end))
+        return entry
+    
+    # Not in memory: try the on-disk cache, if enabled
+    use_disk = _AstCache.enabled()
+    tree = _AstCache.load(data) if use_disk else None
+    
+    try:
+        if tree is None:
+            tree = ast.parse(content, filename=filename, **_PARSE_OPTIONS)
+            if use_disk:
+                _AstCache.store(data, tree)
+    except SyntaxError as e:
+        _remember_ast(key, (type(e), e.msg, (e.filename, e.lineno, e.offset, e.text, e.end_lineno, e.end_offset)))
+        raise
+    
+    _remember_ast(key, tree)
+    return tree
+
+
+def _remember_ast(key: bytes, entry: Union[ast.Module, tuple]) -> None:
+    """Store a tree (or a SyntaxError's details) in the LRU, evicting the oldest."""
+    with _ast_cache_lock:
+        _ast_cache[key] = entry
+        if len(_ast_cache) > _AST_CACHE_MAXSIZE:
+            _ast_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=512)
+def _parse_path(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    """Read and parse a validated file, memoized on its stat signature.
+    
+    mtime_ns and size are only part of the key: a file that changes gets a
+    new entry, so warm calls skip both the read and the source hashing.
+    The caller validates the path first, so no sandbox is needed here (and
+    none is kept alive by the cache).
+    
+    The file is read once. Its bytes go straight to the parser; if that
+    fails they are decoded as read_file would (UTF-8, else latin-1, with
+    universal newlines) and parsed as text. A SyntaxError from the text
+    parse carries that text as ``source_text``, so the caller can report
+    it without reading the file again.
+    
+    Raises:
+        ParsingError: If the file cannot be read
+        SyntaxError: If the code cannot be parsed
+    """
+    try:
+        with open(path_str, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise ParsingError(f"Failed to read file: {type(e).__name__}: {e}", code_snippet=None)
+    try:
+        return _parse_cached(data, filename=path_str)
+    except SyntaxError:
+        pass
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    try:
+        return _parse_cached(text, filename=path_str)
+    except SyntaxError as e:
+        e.source_text = text
+        raise
+
+
+def clear_ast_cache() -> None:
+    """Drop all cached ASTs (e.g. to release memory after a large scan)."""
+    with _ast_cache_lock:
+        _ast_cache.clear()
+    _parse_path.cache_clear()
+    _extract_by_stat.cache_clear()
+
+
+_ts_parser = None
+_ts_parser_lock = threading.Lock()
+
+
+def _get_ts_parser():
+    """Return the shared tree-sitter parser, or None if tree-sitter is missing."""
+    global _ts_parser
+    if _ts_python is None:
+        return None
+    with _ts_parser_lock:
+        if _ts_parser is None:
+            _ts_parser = _TSParser(_TSLanguage(_ts_python.language()))
+        return _ts_parser
+
+
+class _FieldDict:
+    """Mixin giving slotted dataclasses a flat ``to_dict``."""
+    
+    __slots__ = ()
+    _FIELDS: Tuple[str, ...] = ()
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+
+def _with_field_names(cls):
+    """Record a dataclass's field names once, for ``_FieldDict.to_dict``."""
+    cls._FIELDS = tuple(f.name for f in fields(cls))
+    return cls
+
+
+@_with_field_names
+@dataclass(slots=True)
+class FunctionInfo(_FieldDict):
     """Information about a function definition.
     
     Attributes:
@@ -40,21 +277,11 @@ class FunctionInfo:
     has_docstring: bool = False
     is_async: bool = False
     decorators: List[str] = field(default_factory=list)
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "name": self.name,
-            "line_number": self.line_number,
-            "parameters": self.parameters,
-            "has_docstring": self.has_docstring,
-            "is_async": self.is_async,
-            "decorators": self.decorators
-        }
-
-
-@dataclass
-class ClassInfo:
+
+
+@_with_field_names
+@dataclass(slots=True)
+class ClassInfo(_FieldDict):
     """Information about a class definition.
     
     Attributes:
@@ -69,20 +296,11 @@ class ClassInfo:
     base_classes: List[str] = field(default_factory=list)
     methods: List[str] = field(default_factory=list)
     has_docstring: bool = False
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "name": self.name,
-            "line_number": self.line_number,
-            "base_classes": self.base_classes,
-            "methods": self.methods,
-            "has_docstring": self.has_docstring
-        }
 
 
-@dataclass
-class ImportInfo:
+@_with_field_names
+@dataclass(slots=True)
+class ImportInfo(_FieldDict):
     """Information about an import statement.
     
     Attributes:
@@ -97,20 +315,11 @@ class ImportInfo:
     names: List[str] = field(default_factory=list)
     alias: Optional[str] = None
     is_from_import: bool = False
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "module": self.module,
-            "line_number": self.line_number,
-            "names": self.names,
-            "alias": self.alias,
-            "is_from_import": self.is_from_import
-        }
 
 
-@dataclass
-class CodeMetrics:
+@_with_field_names
+@dataclass(slots=True)
+class CodeMetrics(_FieldDict):
     """Code complexity metrics.
     
     Attributes:
@@ -129,18 +338,411 @@ class CodeMetrics:
     class_count: int = 0
     import_count: int = 0
     max_line_length: int = 0
+
+
+# Node classes bound once for exact-type checks in the extractors. ast.parse
+# only produces these exact classes, so `type(node) is X` is equivalent to
+# isinstance and skips the MRO walk.
+_FunctionDef = ast.FunctionDef
+_AsyncFunctionDef = ast.AsyncFunctionDef
+_ClassDef = ast.ClassDef
+_Import = ast.Import
+_ImportFrom = ast.ImportFrom
+_Expr = ast.Expr
+_Constant = ast.Constant
+_Name = ast.Name
+_Call = ast.Call
+_Attribute = ast.Attribute
+
+
+# Fields that hold statement lists (or except handlers / match cases, which
+# hold statement lists themselves). Definitions and imports are statements,
+# so these are the only fields a search for them has to follow. The table is
+# built once at import: node types with no such field (every leaf statement)
+# are simply absent, so the walk skips them with one failed lookup.
+_BLOCK_FIELDS = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+_block_fields_by_type: Dict[type, Tuple[str, ...]] = {
+    cls: names
+    for cls in vars(ast).values()
+    if isinstance(cls, type) and issubclass(cls, ast.AST)
+    for names in [tuple(name for name in cls._fields if name in _BLOCK_FIELDS)]
+    if names
+}
+
+
+def _iter_statements(tree: ast.AST):
+    """Yield statement-level nodes breadth-first, never entering expressions.
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "total_lines": self.total_lines,
-            "code_lines": self.code_lines,
-            "comment_lines": self.comment_lines,
-            "function_count": self.function_count,
-            "class_count": self.class_count,
-            "import_count": self.import_count,
-            "max_line_length": self.max_line_length
-        }
+    Yields the same statements, in the same order, as ``ast.walk`` would,
+    but skips every expression subtree (plus the except handlers and match
+    cases that lead to nested statements).
+    """
+    get_names = _block_fields_by_type.get
+    queue = [tree]
+    for node in queue:
+        yield node
+        names = get_names(type(node))
+        if names:
+            for name in names:
+                block = getattr(node, name)
+                if type(block) is list:
+                    queue.extend(block)
+
+
+def _has_docstring(node: ast.AST) -> bool:
+    """Whether a def/class body starts with a string literal."""
+    body = node.body
+    if not body:
+        return False
+    first = body[0]
+    if type(first) is not _Expr:
+        return False
+    value = first.value
+    return type(value) is _Constant and type(value.value) is str
+
+
+def _function_row(node: ast.AST, parameters: bool = True, decorators: bool = True) -> tuple:
+    """Raw fields of a FunctionDef/AsyncFunctionDef node, in FunctionInfo order.
+    
+    ``FunctionInfo(*row)`` builds the dataclass; callers that only need a
+    field or two can read the tuple and skip the object. Passing False for
+    ``parameters`` or ``decorators`` leaves that list empty.
+    """
+    # Extract decorators
+    decorator_names = []
+    for dec in (node.decorator_list if decorators else ()):
+        t = type(dec)
+        if t is _Name:
+            decorator_names.append(dec.id)
+        elif t is _Call and type(dec.func) is _Name:
+            decorator_names.append(dec.func.id)
+    
+    return (
+        node.name,
+        node.lineno,
+        [arg.arg for arg in node.args.args] if parameters else [],
+        _has_docstring(node),
+        type(node) is _AsyncFunctionDef,
+        decorator_names
+    )
+
+
+def _function_info(node: ast.AST) -> FunctionInfo:
+    """Build FunctionInfo for a FunctionDef/AsyncFunctionDef node."""
+    return FunctionInfo(*_function_row(node))
+
+
+def _class_info(node: ast.ClassDef) -> ClassInfo:
+    """Build ClassInfo for a ClassDef node."""
+    # Extract base classes
+    base_classes = []
+    for base in node.bases:
+        t = type(base)
+        if t is _Name:
+            base_classes.append(base.id)
+        elif t is _Attribute:
+            base_classes.append(base.attr)
+    
+    # Extract methods
+    methods = [item.name for item in node.body if type(item) is _FunctionDef]
+    
+    return ClassInfo(
+        name=node.name,
+        line_number=node.lineno,
+        base_classes=base_classes,
+        methods=methods,
+        has_docstring=_has_docstring(node)
+    )
+
+
+def _import_infos(node: ast.AST) -> List[ImportInfo]:
+    """Build ImportInfo entries for an Import (one per name) or ImportFrom node."""
+    if type(node) is _Import:
+        return [
+            ImportInfo(
+                module=alias.name,
+                line_number=node.lineno,
+                alias=alias.asname,
+                is_from_import=False
+            )
+            for alias in node.names
+        ]
+    return [ImportInfo(
+        module=node.module or "",
+        line_number=node.lineno,
+        names=[alias.name for alias in node.names],
+        is_from_import=True
+    )]
+
+
+class _ExtractorVisitor:
+    """Visitor collecting functions, classes and imports in one pass.
+
+    Handlers follow the ``ast.NodeVisitor`` naming (``visit_<NodeType>``)
+    but are bound once into a type-keyed table and driven by
+    ``_iter_statements``, so expression subtrees are never entered and
+    results keep breadth-first order.
+    """
+
+    __slots__ = ("functions", "classes", "imports")
+
+    def __init__(self):
+        self.functions: List[FunctionInfo] = []
+        self.classes: List[ClassInfo] = []
+        self.imports: List[ImportInfo] = []
+
+    def visit_FunctionDef(self, node: ast.AST) -> None:
+        self.functions.append(_function_info(node))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append(_class_info(node))
+
+    def visit_Import(self, node: ast.AST) -> None:
+        self.imports.extend(_import_infos(node))
+
+    visit_ImportFrom = visit_Import
+
+    def run(self, tree: ast.Module) -> "_ExtractorVisitor":
+        """Visit every definition and import statement in ``tree``."""
+        get_handler = {
+            node_type: getattr(self, "visit_" + node_type.__name__)
+            for node_type in (_FunctionDef, _AsyncFunctionDef, _ClassDef, _Import, _ImportFrom)
+        }.get
+        for node in _iter_statements(tree):
+            handler = get_handler(type(node))
+            if handler is not None:
+                handler(node)
+        return self
+
+
+def _function_rows(tree: ast.Module, wanted: Optional[Set[str]] = None) -> List[tuple]:
+    """Collect ``_function_row`` tuples for every function (breadth-first).
+    
+    ``wanted`` names the FunctionInfo list fields to fill (None for all);
+    ``parameters`` and ``decorators`` are left empty unless named.
+    """
+    parameters = wanted is None or "parameters" in wanted
+    decorators = wanted is None or "decorators" in wanted
+    return [
+        _function_row(node, parameters, decorators) for node in _iter_statements(tree)
+        if type(node) is _FunctionDef or type(node) is _AsyncFunctionDef
+    ]
+
+
+def _ast_functions(tree: ast.Module, wanted: Optional[Set[str]] = None) -> List[FunctionInfo]:
+    """Collect FunctionInfo for every function in an ast tree (breadth-first)."""
+    return [FunctionInfo(*row) for row in _function_rows(tree, wanted)]
+
+
+def _import_modules(tree: ast.Module) -> List[str]:
+    """Imported module names in ``extract_imports`` order, without ImportInfo."""
+    modules: List[str] = []
+    for node in _iter_statements(tree):
+        t = type(node)
+        if t is _Import:
+            modules.extend(alias.name for alias in node.names)
+        elif t is _ImportFrom and node.module:
+            modules.append(node.module)
+    return modules
+
+
+def _ts_is_docstring(block) -> bool:
+    """Whether a tree-sitter block starts with a plain (non-f, non-bytes) string."""
+    if not block.named_children:
+        return False
+    first = block.named_children[0]
+    if first.type != "expression_statement" or not first.named_children:
+        return False
+    expr = first.named_children[0]
+    parts = expr.named_children if expr.type == "concatenated_string" else [expr]
+    for part in parts:
+        if part.type != "string":
+            return False
+        prefix = part.children[0].text.lower()
+        if b"f" in prefix or b"b" in prefix:
+            return False
+    return True
+
+
+# Parameter nodes that end the regular parameter list
+_TS_SPLATS = ("list_splat_pattern", "keyword_separator", "dictionary_splat_pattern")
+
+
+def _ts_parameters(params) -> List[str]:
+    """Names of regular positional-or-keyword parameters, as in ``args.args``."""
+    names: List[str] = []
+    for child in params.named_children:
+        kind = child.type
+        if kind == "typed_parameter" and child.named_children[0].type in _TS_SPLATS:
+            kind = child.named_children[0].type  # '*args: T' / '**kw: T'
+        if kind == "positional_separator":
+            names = []  # everything so far was positional-only
+        elif kind in _TS_SPLATS:
+            break
+        elif kind == "identifier":
+            names.append(child.text.decode("utf-8"))
+        else:
+            name = child.child_by_field_name("name")
+            if name is None and child.named_children:
+                name = child.named_children[0]
+            if name is not None:
+                names.append(name.text.decode("utf-8"))
+    return names
+
+
+def _ts_decorators(node) -> List[str]:
+    """Decorator names, as extract_functions reports them (Name or Call of Name)."""
+    parent = node.parent
+    if parent is None or parent.type != "decorated_definition":
+        return []
+    decorators: List[str] = []
+    for dec in parent.named_children:
+        if dec.type != "decorator" or not dec.named_children:
+            continue
+        expr = dec.named_children[0]
+        if expr.type == "call":
+            expr = expr.child_by_field_name("function")
+        if expr is not None and expr.type == "identifier":
+            decorators.append(expr.text.decode("utf-8"))
+    return decorators
+
+
+# Tree-sitter nodes that hold nested statements one level deeper, matching
+# the ast nodes _iter_statements queues (statements, except handlers, match
+# cases). Other nodes (block, decorated_definition, else/finally clauses)
+# only group their children, as the matching ast fields do.
+_TS_LEVEL_TYPES = frozenset({
+    "function_definition", "class_definition", "if_statement", "elif_clause",
+    "for_statement", "while_statement", "try_statement", "with_statement",
+    "match_statement", "except_clause", "except_group_clause", "case_clause",
+})
+
+
+def _ts_functions(tree) -> List[FunctionInfo]:
+    """Collect FunctionInfo from a tree-sitter tree, in _ast_functions order.
+    
+    _ast_functions is breadth-first over statements, which is the same as
+    ordering by (statement depth, source position). The tree is walked
+    once, tracking the depth the ast statement for each node would have,
+    and the functions are sorted on that key.
+    """
+    found = []
+    stack = [(tree.root_node, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_type = node.type
+        if node_type == "function_definition":
+            found.append((depth, node.start_byte, FunctionInfo(
+                name=node.child_by_field_name("name").text.decode("utf-8"),
+                line_number=node.start_point[0] + 1,
+                parameters=_ts_parameters(node.child_by_field_name("parameters")),
+                has_docstring=_ts_is_docstring(node.child_by_field_name("body")),
+                is_async=node.children[0].type == "async",
+                decorators=_ts_decorators(node)
+            )))
+        child_depth = depth + 1 if node_type in _TS_LEVEL_TYPES or node is tree.root_node else depth
+        if node_type == "if_statement":
+            # ast nests each elif as an If in the previous orelse, so every
+            # elif (and a final else) sits one level below the one before
+            for child in node.named_children:
+                stack.append((child, child_depth))
+                if child.type == "elif_clause":
+                    child_depth += 1
+        else:
+            stack.extend((child, child_depth) for child in node.named_children)
+    found.sort(key=lambda item: item[:2])
+    return [info for _, _, info in found]
+
+
+def functions_from_tree(tree: Any) -> List[FunctionInfo]:
+    """Extract function definitions from an ast or tree-sitter tree.
+    
+    Accepts whatever CodeParser.parse_file_incremental returned, so callers
+    do not need to know whether tree-sitter is installed.
+    
+    Args:
+        tree: ``ast.Module`` or ``tree_sitter.Tree``
+        
+    Returns:
+        List of FunctionInfo objects
+    """
+    if isinstance(tree, ast.AST):
+        return _ast_functions(tree)
+    return _ts_functions(tree)
+
+
+def compute_metrics(tree: Optional[ast.Module], source: str,
+                    line_metrics: bool = True) -> CodeMetrics:
+    """Compute code metrics from an already-parsed tree and its source.
+    
+    Walks the tree once and the text once, updating every counter in the
+    same pass. Counts match the extractors: functions include async
+    functions and methods, and each name in a plain ``import a, b`` counts
+    as one import while a ``from x import a, b`` counts once.
+    
+    Args:
+        tree: Parsed module, or None if the source does not parse
+            (structural counts are then left at zero)
+        source: Source text the tree was parsed from
+        line_metrics: Compute code/comment/max-length line metrics. When
+            False only total_lines is taken, with a single count('\\n'),
+            and the per-line scan is skipped.
+        
+    Returns:
+        CodeMetrics object
+        
+    Example:
+        >>> metrics = compute_metrics(ast.parse(code), code)
+        >>> print(metrics.function_count)
+    """
+    # total_lines is a C-level count; a trailing newline still counts as
+    # starting a final (empty) line, as with the original split('\n').
+    # Other line metrics stream from a StringIO rather than a split list.
+    total_lines = source.count('\n') + 1
+    code_lines = 0
+    comment_lines = 0
+    max_line_length = 0
+    longest = 0
+    for line in (io.StringIO(source) if line_metrics else ()):
+        if len(line) > longest:
+            longest = len(line)
+        stripped = line.lstrip()
+        if stripped:
+            if stripped[0] == '#':
+                comment_lines += 1
+            else:
+                code_lines += 1
+    if line_metrics:
+        # Every line but the last keeps its '\n', so drop one from the
+        # longest and compare against the last line measured directly
+        max_line_length = max(longest - 1, len(source) - source.rfind('\n') - 1)
+    
+    function_count = 0
+    class_count = 0
+    import_count = 0
+    if tree is not None:
+        for node in _iter_statements(tree):
+            t = type(node)
+            if t is _FunctionDef or t is _AsyncFunctionDef:
+                function_count += 1
+            elif t is _ClassDef:
+                class_count += 1
+            elif t is _Import:
+                import_count += len(node.names)
+            elif t is _ImportFrom:
+                import_count += 1
+    
+    return CodeMetrics(
+        total_lines=total_lines,
+        code_lines=code_lines,
+        comment_lines=comment_lines,
+        function_count=function_count,
+        class_count=class_count,
+        import_count=import_count,
+        max_line_length=max_line_length
+    )
 
 
 class CodeParser:
@@ -171,28 +773,24 @@ class CodeParser:
             filepath: Path to Python file
             
         Returns:
-            AST Module object, or None if parsing fails
+            AST Module object, or None if parsing fails. The tree may be
+            shared with other callers through the AST cache; do not mutate it.
             
         Raises:
             ParsingError: If file cannot be parsed
         """
         try:
-            # Read file
-            result = read_file(filepath, self._sandbox)
-            if not result.success:
-                raise ParsingError(
-                    f"Failed to read file: {result.error}",
-                    code_snippet=None
-                )
-            
-            # Parse AST
-            tree = ast.parse(result.content, filename=str(filepath))
-            return tree
+            # Unchanged files (same mtime and size) skip the read entirely;
+            # otherwise the tree is still shared by content hash
+            safe_path = self._sandbox.validate_path(filepath)
+            st = os.stat(safe_path)
+            return _parse_path(os.fspath(safe_path), st.st_mtime_ns, st.st_size)
             
         except SyntaxError as e:
+            source = getattr(e, "source_text", None)
             raise ParsingError(
                 f"Syntax error: {e.msg}",
-                code_snippet=result.content[:200] if result.content else None,
+                code_snippet=source[:200] if source else None,
                 line_number=e.lineno
             )
         except Exception as e:
@@ -201,11 +799,99 @@ class CodeParser:
                 code_snippet=None
             )
     
-    def extract_functions(self, filepath: Union[str, Path]) -> List[FunctionInfo]:
+    def parse_file_incremental(self, filepath: Union[str, Path], prev_tree: Any = None,
+                               edit: Optional[Dict[str, Any]] = None) -> Any:
+        """Parse a file, reusing a previous tree-sitter tree where possible.
+        
+        With tree-sitter installed this returns a ``tree_sitter.Tree``; given
+        the tree from the previous parse and the edit made since, only the
+        changed region is re-parsed. Without tree-sitter it falls back to
+        ``parse_file`` and returns an ``ast.Module``. Use
+        ``functions_from_tree`` to read either kind.
+        
+        Args:
+            filepath: Path to Python file
+            prev_tree: Tree returned by the previous call for this file
+            edit: The edit applied since ``prev_tree``, as keyword arguments
+                for ``Tree.edit`` (start_byte, old_end_byte, new_end_byte,
+                start_point, old_end_point, new_end_point)
+            
+        Returns:
+            tree_sitter.Tree, or ast.Module when tree-sitter is unavailable
+            
+        Raises:
+            ParsingError: If the file cannot be read or has syntax errors
+            
+        Example:
+            >>> tree = parser.parse_file_incremental("code.py")
+            >>> # ... edit code.py, describing the change in `edit` ...
+            >>> tree = parser.parse_file_incremental("code.py", tree, edit)
+            >>> functions = functions_from_tree(tree)
+        """
+        ts_parser = _get_ts_parser()
+        if ts_parser is None or isinstance(prev_tree, ast.AST):
+            return self.parse_file(filepath)
+        
+        result = read_file(filepath, self._sandbox)
+        if not result.success:
+            raise ParsingError(f"Failed to read file: {result.error}", code_snippet=None)
+        
+        source = result.content.encode("utf-8")
+        if prev_tree is None:
+            tree = ts_parser.parse(source)
+        else:
+            if edit:
+                prev_tree.edit(**edit)
+            tree = ts_parser.parse(source, prev_tree)
+        
+        if tree.root_node.has_error:
+            raise ParsingError(
+                "Syntax error",
+                code_snippet=result.content[:200] if result.content else None
+            )
+        return tree
+    
+    @staticmethod
+    def _walk_all(tree: ast.Module) -> Tuple[List[FunctionInfo], List[ClassInfo], List[ImportInfo]]:
+        """Collect functions, classes and imports in a single tree walk.
+        
+        Results match the individual extractors.
+        """
+        visitor = _ExtractorVisitor().run(tree)
+        return visitor.functions, visitor.classes, visitor.imports
+    
+    def extract_all(self, filepath: Union[str, Path]) -> Tuple[List[FunctionInfo], List[ClassInfo], List[ImportInfo]]:
+        """Extract functions, classes and imports with one parse and one walk.
+        
+        Args:
+            filepath: Path to Python file
+            
+        Returns:
+            (functions, classes, imports), as the individual extractors
+            would return them
+            
+        Example:
+            >>> functions, classes, imports = parser.extract_all("code.py")
+        """
+        try:
+            tree = self.parse_file(filepath)
+            if tree is None:
+                return [], [], []
+            return self._walk_all(tree)
+        except ParsingError:
+            raise
+        except Exception as e:
+            raise ParsingError(f"Failed to extract definitions: {str(e)}")
+    
+    def extract_functions(self, filepath: Union[str, Path],
+                          wanted: Optional[Set[str]] = None) -> List[FunctionInfo]:
         """Extract all function definitions from a file.
         
         Args:
             filepath: Path to Python file
+            wanted: FunctionInfo fields the caller needs, or None for all.
+                ``parameters`` and ``decorators`` are only built when named
+                (otherwise left empty); the other fields are always set.
             
         Returns:
             List of FunctionInfo objects
@@ -219,40 +905,7 @@ class CodeParser:
             if tree is None:
                 return []
             
-            functions: List[FunctionInfo] = []
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                    # Extract parameters
-                    params = [arg.arg for arg in node.args.args]
-                    
-                    # Check for docstring
-                    has_docstring = (
-                        len(node.body) > 0 and
-                        isinstance(node.body[0], ast.Expr) and
-                        isinstance(node.body[0].value, ast.Constant) and
-                        isinstance(node.body[0].value.value, str)
-                    )
-                    
-                    # Extract decorators
-                    decorators = []
-                    for dec in node.decorator_list:
-                        if isinstance(dec, ast.Name):
-                            decorators.append(dec.id)
-                        elif isinstance(dec, ast.Call) and isinstance(dec.func, ast.Name):
-                            decorators.append(dec.func.id)
-                    
-                    func_info = FunctionInfo(
-                        name=node.name,
-                        line_number=node.lineno,
-                        parameters=params,
-                        has_docstring=has_docstring,
-                        is_async=isinstance(node, ast.AsyncFunctionDef),
-                        decorators=decorators
-                    )
-                    functions.append(func_info)
-            
-            return functions
+            return _ast_functions(tree, wanted)
             
         except ParsingError:
             raise
@@ -278,42 +931,7 @@ class CodeParser:
             if tree is None:
                 return []
             
-            classes: List[ClassInfo] = []
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    # Extract base classes
-                    base_classes = []
-                    for base in node.bases:
-                        if isinstance(base, ast.Name):
-                            base_classes.append(base.id)
-                        elif isinstance(base, ast.Attribute):
-                            base_classes.append(base.attr)
-                    
-                    # Extract methods
-                    methods = []
-                    for item in node.body:
-                        if isinstance(item, ast.FunctionDef):
-                            methods.append(item.name)
-                    
-                    # Check for docstring
-                    has_docstring = (
-                        len(node.body) > 0 and
-                        isinstance(node.body[0], ast.Expr) and
-                        isinstance(node.body[0].value, ast.Constant) and
-                        isinstance(node.body[0].value.value, str)
-                    )
-                    
-                    class_info = ClassInfo(
-                        name=node.name,
-                        line_number=node.lineno,
-                        base_classes=base_classes,
-                        methods=methods,
-                        has_docstring=has_docstring
-                    )
-                    classes.append(class_info)
-            
-            return classes
+            return [_class_info(node) for node in _iter_statements(tree) if type(node) is _ClassDef]
             
         except ParsingError:
             raise
@@ -340,28 +958,10 @@ class CodeParser:
                 return []
             
             imports: List[ImportInfo] = []
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        import_info = ImportInfo(
-                            module=alias.name,
-                            line_number=node.lineno,
-                            alias=alias.asname,
-                            is_from_import=False
-                        )
-                        imports.append(import_info)
-                
-                elif isinstance(node, ast.ImportFrom):
-                    names = [alias.name for alias in node.names]
-                    import_info = ImportInfo(
-                        module=node.module or "",
-                        line_number=node.lineno,
-                        names=names,
-                        is_from_import=True
-                    )
-                    imports.append(import_info)
-            
+            for node in _iter_statements(tree):
+                t = type(node)
+                if t is _Import or t is _ImportFrom:
+                    imports.extend(_import_infos(node))
             return imports
             
         except ParsingError:
@@ -415,61 +1015,81 @@ class CodeParser:
             if not result.success:
                 return CodeMetrics()
             
-            content = result.content
-            lines = content.split('\n')
-            
-            # Count lines
-            total_lines = len(lines)
-            comment_lines = sum(1 for line in lines if line.strip().startswith('#'))
-            code_lines = sum(1 for line in lines if line.strip() and not line.strip().startswith('#'))
-            
-            # Max line length
-            max_line_length = max(len(line) for line in lines) if lines else 0
-            
-            # Try to parse AST for function/class counts
-            function_count = 0
-            class_count = 0
-            import_count = 0
-            
+            # Parse the content already read (no second read through
+            # parse_file), then one fused pass over tree and text
             try:
-                tree = self.parse_file(filepath)
-                if tree:
-                    function_count = len(self.extract_functions(filepath))
-                    class_count = len(self.extract_classes(filepath))
-                    import_count = len(self.extract_imports(filepath))
-            except:
-                pass
+                tree = _parse_cached(result.content, filename=str(filepath))
+            except SyntaxError:
+                tree = None
             
-            return CodeMetrics(
-                total_lines=total_lines,
-                code_lines=code_lines,
-                comment_lines=comment_lines,
-                function_count=function_count,
-                class_count=class_count,
-                import_count=import_count,
-                max_line_length=max_line_length
-            )
+            return compute_metrics(tree, result.content)
             
         except Exception as e:
             return CodeMetrics()
 
 
+def _extract(kind: str, filepath: Union[str, Path], sandbox: SandboxManager,
+             wanted: Optional[frozenset] = None) -> tuple:
+    """Run one module-level extraction ("functions", "classes" or "imports")."""
+    parser = CodeParser(sandbox)
+    if kind == "functions":
+        return tuple(parser.extract_functions(filepath, wanted))
+    if kind == "classes":
+        return tuple(parser.extract_classes(filepath))
+    tree = parser.parse_file(filepath)
+    return tuple(_import_modules(tree)) if tree is not None else ()
+
+
+@lru_cache(maxsize=1024)
+def _extract_by_stat(kind: str, path_str: str, mtime_ns: int, size: int,
+                     sandbox: SandboxManager, wanted: Optional[frozenset] = None) -> tuple:
+    """``_extract`` for a validated file, memoized on its stat signature.
+    
+    Like ``_parse_path``, mtime_ns and size only key the entry, so an edited
+    file is extracted afresh. The sandbox is part of the key.
+    """
+    return _extract(kind, path_str, sandbox, wanted)
+
+
+def _extract_memoized(kind: str, filepath: Union[str, Path],
+                      sandbox: Optional[SandboxManager],
+                      wanted: Optional[Set[str]] = None) -> list:
+    """Run a module-level extraction through ``_extract_by_stat``.
+    
+    Returns a new list each call; the items in it are shared between
+    calls and must be treated as read-only.
+    """
+    from .sandbox import get_sandbox
+    sandbox = sandbox or get_sandbox()
+    if wanted is not None:
+        wanted = frozenset(wanted)
+    try:
+        safe_path = sandbox.validate_path(filepath)
+        st = os.stat(safe_path)
+    except Exception:
+        # Uncached, so the parser raises its usual ParsingError
+        return list(_extract(kind, filepath, sandbox, wanted))
+    return list(_extract_by_stat(kind, os.fspath(safe_path), st.st_mtime_ns, st.st_size,
+                                 sandbox, wanted))
+
+
 # Module-level convenience functions
 def extract_functions(filepath: Union[str, Path],
-                     sandbox: Optional[SandboxManager] = None) -> List[FunctionInfo]:
+                     sandbox: Optional[SandboxManager] = None,
+                     wanted: Optional[Set[str]] = None) -> List[FunctionInfo]:
     """Convenience function to extract functions.
     
     Args:
         filepath: Path to Python file
         sandbox: Optional SandboxManager (uses global if None)
+        wanted: FunctionInfo fields needed, or None for all (see
+            CodeParser.extract_functions)
         
     Returns:
-        List of FunctionInfo objects
+        List of FunctionInfo objects (memoized per file version; treat the
+        objects as read-only)
     """
-    from .sandbox import get_sandbox
-    sandbox = sandbox or get_sandbox()
-    parser = CodeParser(sandbox)
-    return parser.extract_functions(filepath)
+    return _extract_memoized("functions", filepath, sandbox, wanted)
 
 
 def extract_classes(filepath: Union[str, Path],
@@ -481,12 +1101,10 @@ def extract_classes(filepath: Union[str, Path],
         sandbox: Optional SandboxManager (uses global if None)
         
     Returns:
-        List of ClassInfo objects
+        List of ClassInfo objects (memoized per file version; treat the
+        objects as read-only)
     """
-    from .sandbox import get_sandbox
-    sandbox = sandbox or get_sandbox()
-    parser = CodeParser(sandbox)
-    return parser.extract_classes(filepath)
+    return _extract_memoized("classes", filepath, sandbox)
 
 
 def get_imports(filepath: Union[str, Path],
@@ -498,10 +1116,108 @@ def get_imports(filepath: Union[str, Path],
         sandbox: Optional SandboxManager
         
     Returns:
-        List of module names
+        List of module names (memoized per file version)
+    """
+    return _extract_memoized("imports", filepath, sandbox)
+
+
+async def parse_files_async(filepaths: List[Union[str, Path]],
+                            sandbox: Optional[SandboxManager] = None,
+                            concurrency: int = 32) -> Dict[Union[str, Path], Union[ast.Module, ParsingError]]:
+    """Read and parse many files, overlapping the reads.
+    
+    Reads run in worker threads (the read syscalls release the GIL), at
+    most ``concurrency`` at a time; each file is parsed through the shared
+    AST cache as soon as its content arrives. A file that cannot be read
+    or parsed maps to the ParsingError ``parse_file`` would have raised,
+    so one bad file does not abort the batch.
+    
+    Args:
+        filepaths: Paths to Python files
+        sandbox: Optional SandboxManager (uses global if None)
+        concurrency: Maximum number of reads in flight
+        
+    Returns:
+        Dictionary mapping each given path to its AST Module (shared, do
+        not mutate) or ParsingError
+        
+    Example:
+        >>> trees = asyncio.run(parse_files_async(["a.py", "b.py"]))
+        >>> ok = {p: t for p, t in trees.items() if isinstance(t, ast.Module)}
+    """
+    from .sandbox import get_sandbox
+    sandbox = sandbox or get_sandbox()
+    limit = asyncio.Semaphore(max(1, concurrency))
+    
+    async def parse_one(filepath):
+        async with limit:
+            result = await asyncio.to_thread(read_file, filepath, sandbox)
+        if not result.success:
+            return ParsingError(f"Failed to parse: {result.error}", code_snippet=None)
+        try:
+            return _parse_cached(result.content, filename=str(filepath))
+        except SyntaxError as e:
+            return ParsingError(
+                f"Syntax error: {e.msg}",
+                code_snippet=result.content[:200],
+                line_number=e.lineno
+            )
+    
+    results = await asyncio.gather(*(parse_one(path) for path in filepaths))
+    return dict(zip(filepaths, results))
+
+
+_worker_parser: Optional[CodeParser] = None
+
+
+def _metrics_in_worker(task: Tuple[str, str]) -> CodeMetrics:
+    """Compute one file's metrics inside a batch_metrics worker process.
+    
+    Args:
+        task: (sandbox root, file path)
+        
+    Returns:
+        CodeMetrics for the file
+    """
+    global _worker_parser
+    root, filepath = task
+    if _worker_parser is None or str(_worker_parser._sandbox.sandbox_root) != root:
+        _worker_parser = CodeParser(SandboxManager(root))
+    return _worker_parser.get_code_metrics(filepath)
+
+
+def batch_metrics(filepaths: List[Union[str, Path]],
+                  sandbox: Optional[SandboxManager] = None,
+                  max_workers: Optional[int] = None) -> Dict[Union[str, Path], CodeMetrics]:
+    """Compute code metrics for many files in parallel worker processes.
+    
+    Parsing is CPU-bound and holds the GIL, so files are spread over a
+    process pool. Only the sandbox root and the paths are sent to workers,
+    which build their own CodeParser. Batches of one run in-process.
+    
+    Args:
+        filepaths: Paths to Python files
+        sandbox: Optional SandboxManager (uses global if None)
+        max_workers: Worker process count (defaults to os.cpu_count())
+        
+    Returns:
+        Dictionary mapping each given path to its CodeMetrics
+        
+    Example:
+        >>> metrics = batch_metrics(["a.py", "b.py"])
+        >>> total = sum(m.code_lines for m in metrics.values())
     """
     from .sandbox import get_sandbox
     sandbox = sandbox or get_sandbox()
-    parser = CodeParser(sandbox)
-    imports = parser.extract_imports(filepath)
-    return [imp.module for imp in imports if imp.module]
+    
+    if len(filepaths) <= 1:
+        parser = CodeParser(sandbox)
+        return {path: parser.get_code_metrics(path) for path in filepaths}
+    
+    root = str(sandbox.sandbox_root)
+    tasks = [(root, str(path)) for path in filepaths]
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_metrics_in_worker, tasks, chunksize=chunksize)
+        return dict(zip(filepaths, results))
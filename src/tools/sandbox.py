@@ -9,9 +9,11 @@ Security Features:
 - Absolute path validation
 - Symlink resolution
 - Platform-independent path handling
+- Per-instance cache of the lexical (string-only) validation step
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional
 from .exceptions import SecurityError
@@ -25,7 +27,8 @@ class SandboxManager:
     file access.
     
     Design Pattern: Single instance per sandbox directory
-    Thread Safety: Thread-safe (no mutable state)
+    Thread Safety: Thread-safe (the only mutable state is the lru_cache of
+        normalized paths)
     
     Example:
         >>> sandbox = SandboxManager("/workspace/sandbox")
@@ -55,8 +58,21 @@ class SandboxManager:
         # Convert to absolute path and resolve symlinks
         self._sandbox_root = Path(sandbox_path).resolve()
         
+        # String forms for the containment check in _normalize,
+        # built once instead of per call
+        self._sandbox_root_str = os.fspath(self._sandbox_root)
+        root_key = os.path.normcase(self._sandbox_root_str)
+        self._root_key = root_key
+        self._root_prefix = root_key if root_key.endswith(os.sep) else root_key + os.sep
+        
+        # Lexical outcomes (normalized path string, or None if it lies
+        # outside), keyed by the path string as given. Symlinks are resolved
+        # on every call instead, since they can change between calls. Built
+        # per instance so one sandbox's results never answer for another.
+        self._normalize_cached = lru_cache(maxsize=4096)(self._try_normalize)
+        
         # Ensure sandbox directory exists
-        self._sandbox_root.mkdir(parents=True, exist_ok=True)
+        self.ensure_exists()
     
     @property
     def sandbox_root(self) -> Path:
@@ -90,36 +106,65 @@ class SandboxManager:
             >>> sandbox = SandboxManager("/workspace/sandbox")
             >>> sandbox.validate_path("subdir/code.py")
             PosixPath('/workspace/sandbox/subdir/code.py')
+        
+        Note:
+            The string-only normalization is cached per path string (shared
+            with is_safe). Symlinks are resolved on every call, so a file
+            swapped for a link after an earlier check is still caught.
         """
         if not path:
             raise ValueError("Path cannot be empty")
         
-        path = Path(path)
-        
-        # If path is relative, treat it as relative to sandbox root
-        if not path.is_absolute():
-            path = self._sandbox_root / path
-        
-        # Resolve to absolute path (follows symlinks, removes ..)
+        path_str = os.fspath(path)
+        normalized = self._normalize_cached(path_str)
+        if normalized is None:
+            # Rejected: normalize again only to raise the detailed error
+            self._normalize(path_str)
+        return self._resolve(normalized)
+    
+    def _try_normalize(self, path_str: str) -> Optional[str]:
+        """_normalize returning None instead of raising SecurityError."""
+        try:
+            return self._normalize(path_str)
+        except SecurityError:
+            return None
+    
+    def _normalize(self, path_str: str) -> str:
+        """Lexically normalize one path string and check it stays inside."""
+        # Relative paths are taken from the sandbox root; normpath removes
+        # '..' and redundant separators with string operations only, so
+        # plain traversal is rejected before touching the filesystem
+        path = os.path.normpath(os.path.join(self._sandbox_root_str, path_str))
+        if not self._contains(path):
+            raise SecurityError(
+                f"Path outside sandbox: {path} is not within {self._sandbox_root}",
+                attempted_path=path
+            )
+        return path
+    
+    def _resolve(self, path: str) -> Path:
+        """Follow symlinks in a normalized path and check it stays inside."""
+        # Follow symlinks, so a link inside the sandbox cannot lead out
         try:
-            resolved_path = path.resolve()
+            resolved = os.path.realpath(path)
         except (OSError, RuntimeError) as e:
             raise SecurityError(
                 f"Failed to resolve path: {e}",
-                attempted_path=str(path)
+                attempted_path=path
             )
         
-        # Check if resolved path is within sandbox
-        try:
-            # relative_to() raises ValueError if not a subpath
-            resolved_path.relative_to(self._sandbox_root)
-        except ValueError:
+        if resolved != path and not self._contains(resolved):
             raise SecurityError(
-                f"Path outside sandbox: {resolved_path} is not within {self._sandbox_root}",
-                attempted_path=str(path)
+                f"Path outside sandbox: {resolved} is not within {self._sandbox_root}",
+                attempted_path=path
             )
         
-        return resolved_path
+        return Path(resolved)
+    
+    def _contains(self, path: str) -> bool:
+        """Whether a normalized absolute path string is the root or under it."""
+        key = os.path.normcase(path)
+        return key == self._root_key or key.startswith(self._root_prefix)
     
     def is_safe(self, path: Union[str, Path]) -> bool:
         """Check if a path is safe (within sandbox) without raising exceptions.
@@ -139,11 +184,16 @@ class SandboxManager:
             >>> sandbox.is_safe("../../etc/passwd")
             False
         """
+        if not path:
+            return False
+        normalized = self._normalize_cached(os.fspath(path))
+        if normalized is None:
+            return False
         try:
-            self.validate_path(path)
-            return True
-        except (SecurityError, ValueError):
+            self._resolve(normalized)
+        except SecurityError:
             return False
+        return True
     
     def get_safe_path(self, relative_path: Union[str, Path]) -> Path:
         """Get a safe path by joining with sandbox root.
@@ -172,9 +222,11 @@ class SandboxManager:
         """Ensure the sandbox directory exists.
         
         Creates the sandbox directory if it doesn't exist.
-        Safe to call multiple times (idempotent).
+        Safe to call multiple times (idempotent). An existing directory
+        costs one stat, rather than a failing mkdir.
         """
-        self._sandbox_root.mkdir(parents=True, exist_ok=True)
+        if not os.path.isdir(self._sandbox_root_str):
+            os.makedirs(self._sandbox_root_str, exist_ok=True)
     
     def list_python_files(self, subdir: Optional[Union[str, Path]] = None) -> list[Path]:
         """List all Python files in the sandbox (or a subdirectory).
@@ -199,8 +251,22 @@ class SandboxManager:
         else:
             search_dir = self._sandbox_root
         
-        # Find all .py files recursively
-        return sorted(search_dir.rglob("*.py"))
+        # Find all .py files recursively. os.walk works on scandir entries
+        # and strings; Paths are only built for directories with matches,
+        # and each file is joined onto its directory's Path. Like rglob, it
+        # does not descend into symlinked directories.
+        matches = []
+        for dirpath, _dirnames, filenames in os.walk(search_dir):
+            names = [name for name in filenames if name.endswith(".py")]
+            if names:
+                base = Path(dirpath)
+                matches.extend(base / name for name in names)
+        matches.sort()
+        return matches
+    
+    def clear_path_cache(self) -> None:
+        """Forget all cached path normalizations."""
+        self._normalize_cached.cache_clear()
     
     def cleanup(self, preserve_structure: bool = False) -> None:
         """Clean up the sandbox directory.
@@ -214,11 +280,19 @@ class SandboxManager:
             >>> sandbox = SandboxManager("/workspace/sandbox")
             >>> sandbox.cleanup(preserve_structure=True)  # Remove files, keep folders
         """
+        self.clear_path_cache()
+        
         if preserve_structure:
-            # Only delete files
-            for file_path in self._sandbox_root.rglob("*"):
-                if file_path.is_file():
-                    file_path.unlink()
+            # Only delete files, walking with scandir so the type checks
+            # reuse what readdir returned instead of a stat per entry
+            pending = [self._sandbox_root_str]
+            while pending:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            os.unlink(entry.path)
         else:
             # Delete everything
             import shutil
@@ -9,11 +9,20 @@ Features:
 - Timeout protection (60s default)
 - Detailed failure information
 - Test statistics and success rate calculation
+- Results read from pytest's built-in JUnit XML report
+- Optional in-process mode that skips interpreter and plugin startup
 """
 
+import io
+import os
+import sys
 import subprocess
-import json
+import time
 import re
+import tempfile
+import threading
+import xml.etree.ElementTree as ElementTree
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 from typing import Union, Optional, List, Dict, Any
 from dataclasses import dataclass, field
@@ -23,7 +32,26 @@ from .exceptions import TestError, SecurityError
 from .sandbox import SandboxManager
 
 
-@dataclass
+# Console-output patterns, compiled once. Counts and keywords are ASCII;
+# test and file names keep Unicode \w, since identifiers may use it.
+_SUMMARY_RE = re.compile(r"(\d+)\s+(passed|failed|skipped|error)", re.IGNORECASE | re.ASCII)
+_FAILED_RE = re.compile(r"FAILED\s+([\w/.]+)::(\w+)\s*-\s*(.+)")
+_ERRTYPE_RE = re.compile(r"(\w+(?:Error|Exception))")
+_ALT_RE = re.compile(r"=+\s*([\d\s\w,]+)\s+in\s+[\d.]+s", re.ASCII)
+_COUNT_RE = re.compile(r"(\d+)\s+(\w+)", re.ASCII)
+# Summary-line statuses and the stats key each one counts towards
+_SUMMARY_KEYS = {
+    "passed": "passed",
+    "failed": "failed",
+    "skipped": "skipped",
+    "error": "errors",
+    "errors": "errors",
+}
+# Streamed output lines worth keeping besides those matching _SUMMARY_RE
+_KEEP_PREFIXES = ("FAILED", "ERROR", "=")
+
+
+@dataclass(slots=True)
 class FailedTest:
     """Information about a failed test.
     
@@ -54,7 +82,7 @@ class FailedTest:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of test execution.
     
@@ -113,15 +141,21 @@ class PytestRunner:
         ...         print(f"FAILED: {failed.test_name}")
     """
     
-    def __init__(self, sandbox: SandboxManager, timeout: int = 60):
+    def __init__(self, sandbox: SandboxManager, timeout: int = 60,
+                 in_process: bool = False):
         """Initialize PytestRunner.
         
         Args:
             sandbox: SandboxManager for path validation
             timeout: Maximum execution time in seconds (default: 60)
+            in_process: Run Pytest via pytest.main() in this interpreter
+                instead of a subprocess. Saves the interpreter and plugin
+                startup on every call, but gives up crash isolation and
+                the timeout (default: False)
         """
         self._sandbox = sandbox
         self._timeout = timeout
+        self._in_process = in_process
     
     def run_tests(self, test_path: Union[str, Path]) -> TestResult:
         """Run tests with Pytest.
@@ -143,7 +177,7 @@ class PytestRunner:
             >>> result = runner.run_tests("tests/")
             >>> print(f"Pass rate: {result.get_success_rate():.1f}%")
         """
-        start_time = datetime.now()
+        start = time.perf_counter()
         
         try:
             # Validate path
@@ -156,14 +190,20 @@ class PytestRunner:
                     error=f"Test path not found: {safe_path}"
                 )
             
-            # Run pytest
-            raw_output, return_code = self._run_pytest(safe_path)
-            
-            # Parse output
-            stats, failed_tests = self._parse_output(raw_output)
+            # Run pytest, reading results from its JUnit XML report; the
+            # console output is only parsed if no report was written
+            fd, report_path = tempfile.mkstemp(prefix="rswarm-pytest-", suffix=".xml")
+            os.close(fd)
+            try:
+                run = self._run_pytest_in_process if self._in_process else self._run_pytest
+                raw_output, return_code = run(safe_path, report_path)
+                parsed = self._parse_report(report_path)
+            finally:
+                os.unlink(report_path)
+            stats, failed_tests = parsed if parsed is not None else self._parse_output(raw_output)
             
             # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start
             
             # Determine if all tests passed
             all_passed = stats.get("failed", 0) == 0 and stats.get("errors", 0) == 0
@@ -201,14 +241,16 @@ class PytestRunner:
                 error=f"Test execution failed: {type(e).__name__}: {str(e)}"
             )
     
-    def _run_pytest(self, test_path: Path) -> tuple[str, int]:
+    def _run_pytest(self, test_path: Path, report_path: str) -> tuple[str, int]:
         """Execute Pytest as subprocess.
         
         Args:
             test_path: Validated path to tests
+            report_path: File for pytest's JUnit XML report
             
         Returns:
-            Tuple of (combined output, return code)
+            Tuple of (summary-relevant output lines, return code). Output
+            is streamed and only the lines _parse_output can use are kept.
             
         Raises:
             subprocess.TimeoutExpired: If execution exceeds timeout
@@ -221,24 +263,154 @@ class PytestRunner:
             "--tb=short",            # Short traceback format
             "--no-header",           # No header (cleaner output)
             "--no-summary",          # We'll parse our own summary
+            f"--junitxml={report_path}",
+            "-o", "junit_family=xunit1",  # Adds file/line to each testcase
         ]
         
-        # Execute with timeout
-        process = subprocess.run(
+        # Execute, streaming stdout and stderr together; a timer kills the
+        # process if it runs past the timeout
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=self._timeout,
             cwd=str(self._sandbox.sandbox_root)
         )
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            process.kill()
+        
+        watchdog = threading.Timer(self._timeout, kill)
+        watchdog.start()
+        kept = []
+        try:
+            for line in process.stdout:
+                if line.startswith(_KEEP_PREFIXES) or _SUMMARY_RE.search(line):
+                    kept.append(line)
+            return_code = process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                # Reading failed (e.g. undecodable output): don't leave the
+                # child running or unreaped
+                process.kill()
+                process.wait()
+            process.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, self._timeout)
+        
+        return "".join(kept), return_code
+    
+    def _run_pytest_in_process(self, test_path: Path, report_path: str) -> tuple[str, int]:
+        """Execute Pytest in this interpreter via pytest.main().
+        
+        Like the subprocess run, pytest runs from the sandbox root, so
+        relative paths and rootdir discovery behave the same in both modes;
+        the working directory is restored afterwards. Modules imported by
+        the run from the sandbox (or the test path) and sys.path entries
+        added to import them are dropped afterwards, so the next run sees
+        edited sources. Other newly imported modules (pytest plugins,
+        third-party and extension modules) are left loaded.
+        
+        Args:
+            test_path: Validated path to tests
+            report_path: File for pytest's JUnit XML report
+            
+        Returns:
+            Tuple of (captured console output, exit code)
+        """
+        import pytest
+        
+        args = [
+            str(test_path),
+            "-v",
+            "--tb=short",
+            "--no-header",
+            "--no-summary",
+            "-p", "no:cacheprovider",  # Nothing written into the sandbox
+            f"--junitxml={report_path}",
+            "-o", "junit_family=xunit1",
+        ]
+        
+        saved_modules = set(sys.modules)
+        saved_path = list(sys.path)
+        saved_cwd = os.getcwd()
+        output = io.StringIO()
+        try:
+            os.chdir(self._sandbox.sandbox_root)
+            with redirect_stdout(output), redirect_stderr(output):
+                return_code = int(pytest.main(args))
+        finally:
+            os.chdir(saved_cwd)
+            roots = tuple(
+                os.path.join(os.path.realpath(root), "")
+                for root in (self._sandbox.sandbox_root, test_path)
+            )
+            for name in set(sys.modules) - saved_modules:
+                filename = getattr(sys.modules[name], "__file__", None)
+                if filename and os.path.realpath(filename).startswith(roots):
+                    del sys.modules[name]
+            sys.path[:] = saved_path
+        
+        return output.getvalue(), return_code
+    
+    def _parse_report(self, report_path: str) -> Optional[tuple[dict, List[FailedTest]]]:
+        """Parse the JUnit XML report written by a Pytest run.
+        
+        Counts come from the testsuite attributes and failure details from
+        the failure/error elements, so no text scanning is needed.
+        
+        Args:
+            report_path: Path passed to --junitxml
+            
+        Returns:
+            Tuple of (stats dict, list of failed tests), or None if pytest
+            did not write a readable report
+        """
+        try:
+            root = ElementTree.parse(report_path).getroot()
+        except (OSError, ElementTree.ParseError):
+            return None
+        
+        stats = {
+            "total": 0,
+            "passed": 0,
+            "failed": 0,
+            "skipped": 0,
+            "errors": 0
+        }
+        failed_tests: List[FailedTest] = []
         
-        # Combine stdout and stderr
-        combined_output = process.stdout + "\n" + process.stderr
+        for suite in root.iter("testsuite"):
+            stats["total"] += int(suite.get("tests", 0))
+            stats["failed"] += int(suite.get("failures", 0))
+            stats["skipped"] += int(suite.get("skipped", 0))
+            stats["errors"] += int(suite.get("errors", 0))
+            
+            for case in suite.iter("testcase"):
+                for problem in case:
+                    if problem.tag != "failure" and problem.tag != "error":
+                        continue
+                    message = problem.get("message", "")
+                    error_type_match = _ERRTYPE_RE.search(message)
+                    failed_tests.append(FailedTest(
+                        test_name=case.get("name", ""),
+                        test_file=case.get("file", ""),
+                        # xunit1 line numbers are 0-based
+                        line_number=int(case.get("line", -1)) + 1,
+                        error_type=error_type_match.group(1) if error_type_match else "",
+                        error_message=message,
+                        traceback=problem.text or ""
+                    ))
         
-        return combined_output, process.returncode
+        stats["passed"] = max(0, stats["total"] - stats["failed"] - stats["skipped"] - stats["errors"])
+        return stats, failed_tests
     
     def _parse_output(self, raw_output: str) -> tuple[dict, List[FailedTest]]:
-        """Parse Pytest output.
+        """Parse Pytest console output (fallback when no report was written).
         
         Args:
             raw_output: Raw Pytest output
@@ -258,21 +430,23 @@ class PytestRunner:
         try:
             # Parse summary line
             # Format: "5 passed, 2 failed, 1 skipped in 3.2s"
-            summary_pattern = r"(\d+)\s+(passed|failed|skipped|error)"
-            matches = re.findall(summary_pattern, raw_output, re.IGNORECASE)
-            
-            for count, status in matches:
-                count = int(count)
-                status = status.lower()
-                
-                if status == "passed":
-                    stats["passed"] = count
-                elif status == "failed":
-                    stats["failed"] = count
-                elif status == "skipped":
-                    stats["skipped"] = count
-                elif status == "error":
-                    stats["errors"] = count
+            counts = self._split_summary(raw_output)
+            if counts is not None:
+                stats.update(counts)
+            else:
+                # Unexpected layout: pick the counts out wherever they are
+                for count, status in _SUMMARY_RE.findall(raw_output):
+                    count = int(count)
+                    status = status.lower()
+                    
+                    if status == "passed":
+                        stats["passed"] = count
+                    elif status == "failed":
+                        stats["failed"] = count
+                    elif status == "skipped":
+                        stats["skipped"] = count
+                    elif status == "error":
+                        stats["errors"] = count
             
             # Calculate total
             stats["total"] = sum([
@@ -284,8 +458,7 @@ class PytestRunner:
             
             # Parse failed test details
             # Look for FAILED test_file.py::test_name - AssertionError
-            failed_pattern = r"FAILED\s+([\w\/\.]+)::([\w_]+)\s*-\s*(.+)"
-            failed_matches = re.findall(failed_pattern, raw_output)
+            failed_matches = _FAILED_RE.findall(raw_output)
             
             for test_file, test_name, error_info in failed_matches:
                 failed_test = FailedTest(
@@ -295,7 +468,7 @@ class PytestRunner:
                 )
                 
                 # Try to extract error type
-                error_type_match = re.search(r"(\w+Error|\w+Exception)", error_info)
+                error_type_match = _ERRTYPE_RE.search(error_info)
                 if error_type_match:
                     failed_test.error_type = error_type_match.group(1)
                 
@@ -304,12 +477,11 @@ class PytestRunner:
             # If we couldn't parse summary, try alternative format
             if stats["total"] == 0:
                 # Try: "1 failed, 1 passed in 0.12s"
-                alt_pattern = r"=+\s*([\d\s\w,]+)\s+in\s+[\d\.]+s"
-                alt_match = re.search(alt_pattern, raw_output)
+                alt_match = _ALT_RE.search(raw_output)
                 if alt_match:
                     summary_text = alt_match.group(1)
                     # Re-parse from this text
-                    for count, status in re.findall(r"(\d+)\s+(\w+)", summary_text):
+                    for count, status in _COUNT_RE.findall(summary_text):
                         count = int(count)
                         if status in stats:
                             stats[status] = count
@@ -321,6 +493,33 @@ class PytestRunner:
         
         return stats, failed_tests
     
+    def _split_summary(self, raw_output: str) -> Optional[Dict[str, int]]:
+        """Read the counts from Pytest's final summary line.
+        
+        The line has a fixed layout ("==== 1 failed, 3 passed in 0.12s ===="),
+        so plain string splitting is enough.
+        
+        Args:
+            raw_output: Raw Pytest output
+            
+        Returns:
+            Dict of stats keys to counts, or None if the last line is not
+            a summary line in the expected layout
+        """
+        line = raw_output.rstrip().rpartition("\n")[2]
+        if not line.startswith("=") or " in " not in line:
+            return None
+        
+        counts: Dict[str, int] = {}
+        for part in line.strip("= ").rpartition(" in ")[0].split(", "):
+            tokens = part.split()
+            if len(tokens) != 2 or not tokens[0].isdigit():
+                return None
+            key = _SUMMARY_KEYS.get(tokens[1])
+            if key is not None:
+                counts[key] = int(tokens[0])
+        return counts
+    
     def _calculate_success_rate(self, stats: dict) -> float:
         """Calculate success rate from stats.
         
@@ -349,11 +548,15 @@ class PytestRunner:
             safe_path = self._sandbox.validate_path(test_path)
             
             if safe_path.is_file():
-                return safe_path.name.startswith("test_") and safe_path.suffix == ".py"
+                name = safe_path.name
+                return name.startswith("test_") and name.endswith(".py")
             elif safe_path.is_dir():
-                # Check for any test files in directory
-                test_files = list(safe_path.rglob("test_*.py"))
-                return len(test_files) > 0
+                # Check for any test files in directory, stopping at the first
+                return any(
+                    name.startswith("test_") and name.endswith(".py")
+                    for _dirpath, _dirnames, filenames in os.walk(safe_path)
+                    for name in filenames
+                )
             
             return False
         except:
@@ -363,13 +566,15 @@ class PytestRunner:
 # Module-level convenience function
 def run_pytest(test_path: Union[str, Path],
             sandbox: Optional[SandboxManager] = None,
-            timeout: int = 60) -> TestResult:
+            timeout: int = 60,
+            in_process: bool = False) -> TestResult:
     """Convenience function to run Pytest.
     
     Args:
         test_path: Path to test file or directory
         sandbox: Optional SandboxManager (uses global if None)
-        timeout: Timeout in seconds
+        timeout: Timeout in seconds (ignored when in_process is True)
+        in_process: Run Pytest in this interpreter (see PytestRunner)
         
     Returns:
         TestResult
@@ -382,7 +587,7 @@ def run_pytest(test_path: Union[str, Path],
     """
     from .sandbox import get_sandbox
     sandbox = sandbox or get_sandbox()
-    runner = PytestRunner(sandbox, timeout=timeout)
+    runner = PytestRunner(sandbox, timeout=timeout, in_process=in_process)
     return runner.run_tests(test_path)
 
 
@@ -1,5 +1,8 @@
+import atexit
 import json
 import os
+import queue
+import threading
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -29,6 +32,7 @@ def log_experiment(agent_name: str, model_used: str, action: ActionType, details
 
     Raises:
         ValueError: Si les champs obligatoires sont manquants dans 'details' ou si l'action est invalide.
+        TypeError: Si l'entrée n'est pas sérialisable en JSON (ex: un objet dans 'details').
     """
     
     # --- 1. VALIDATION DU TYPE D'ACTION ---
@@ -56,9 +60,6 @@ def log_experiment(agent_name: str, model_used: str, action: ActionType, details
             )
 
     # --- 3. PRÉPARATION DE L'ENTRÉE ---
-    # Création du dossier logs s'il n'existe pas
-    os.makedirs("logs", exist_ok=True)
-    
     entry = {
         "id": str(uuid.uuid4()),  # ID unique pour éviter les doublons lors de la fusion des données
         "timestamp": datetime.now().isoformat(),
@@ -69,21 +70,129 @@ def log_experiment(agent_name: str, model_used: str, action: ActionType, details
         "status": status
     }
 
-    # --- 4. LECTURE & ÉCRITURE ROBUSTE ---
-    data = []
-    if os.path.exists(LOG_FILE):
+    # --- 4. SÉRIALISATION ---
+    # Faite ici, dans le thread de l'appelant : une entrée non sérialisable
+    # lève une erreur à l'appelant, et 'details' est figé au moment de l'appel.
+    text = "    " + json.dumps(entry, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+
+    # --- 5. ÉCRITURE EN ARRIÈRE-PLAN ---
+    # Le texte est confié à un thread d'écriture : l'agent ne bloque pas
+    # sur le disque. Appeler flush_logs() avant de relire le fichier.
+    _start_writer()
+    _LOG_QUEUE.put(text)
+
+
+def flush_logs() -> None:
+    """
+    Attend que toutes les entrées déjà passées à log_experiment soient
+    écrites dans LOG_FILE. Appelée automatiquement à la sortie du programme.
+    """
+    if _writer_thread is not None:
+        _LOG_QUEUE.join()
+
+
+# File des entrées en attente (déjà sérialisées) et thread qui les écrit,
+# démarré au premier log
+_LOG_QUEUE: "queue.Queue[str]" = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_thread = None
+
+
+def _start_writer() -> None:
+    """Démarre le thread d'écriture s'il ne tourne pas encore."""
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _writer_lock:
+        if _writer_thread is None:
+            thread = threading.Thread(target=_writer, name="log-writer", daemon=True)
+            thread.start()
+            atexit.register(flush_logs)
+            _writer_thread = thread
+
+
+def _writer() -> None:
+    """Vide la file par lots : une seule écriture pour toutes les entrées en attente."""
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        while True:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
         try:
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content: # Vérifie que le fichier n'est pas juste vide
-                    data = json.loads(content)
-        except json.JSONDecodeError:
-            # Si le fichier est corrompu, on repart à zéro (ou on pourrait sauvegarder un backup)
-            print(f"⚠️ Attention : Le fichier de logs {LOG_FILE} était corrompu. Une nouvelle liste a été créée.")
-            data = []
-
-    data.append(entry)
-    
-    # Écriture
-    with open(LOG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
\ No newline at end of file
+            # Création du dossier logs s'il n'existe pas
+            os.makedirs(os.path.dirname(LOG_FILE) or ".", exist_ok=True)
+            # Le fichier reste une liste JSON (indent=4), mais seule la fin
+            # est réécrite : pas de relecture de tout l'historique.
+            _append_entries(LOG_FILE, batch)
+        except Exception as e:
+            print(f"⚠️ Attention : {len(batch)} entrée(s) de log non écrite(s) dans {LOG_FILE} : {e}")
+        finally:
+            for _ in batch:
+                _LOG_QUEUE.task_done()
+
+
+_WHITESPACE = b" \t\r\n"
+
+
+def _last_significant(f, end: int) -> int:
+    """Position du dernier octet non blanc avant `end` (-1 s'il n'y en a pas)."""
+    pos = end
+    while pos > 0:
+        start = max(0, pos - 4096)
+        f.seek(start)
+        chunk = f.read(pos - start).rstrip(_WHITESPACE)
+        if chunk:
+            return start + len(chunk) - 1
+        pos = start
+    return -1
+
+
+def _append_entries(path: str, entries: list) -> None:
+    """Ajoute des entrées à la liste JSON de `path` sans relire le fichier.
+
+    `entries` contient les entrées déjà sérialisées par log_experiment
+    (indentées d'un niveau). Le résultat est identique à
+    `json.dump(data, f, indent=4)` sur la liste complète. Si le fichier est
+    absent, vide ou ne ressemble pas à une liste JSON (corrompu), une
+    nouvelle liste est créée.
+
+    Limite : seuls le début ("[") et la fin ("[" ou "}" puis "]") du fichier
+    sont vérifiés, le contenu n'est pas relu. Un fichier dont le cadre est
+    correct mais dont le milieu est corrompu est conservé tel quel et les
+    nouvelles entrées y sont ajoutées.
+    """
+    block = (",\n".join(entries) + "\n]").encode("utf-8")
+
+    with open(path, "a+b") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        close_pos = _last_significant(f, size)
+        f.seek(0)
+        head = f.read(64).lstrip(_WHITESPACE)
+
+        last_pos = -1
+        empty = valid = False
+        if close_pos >= 0 and head[:1] == b"[":
+            f.seek(close_pos)
+            if f.read(1) == b"]":
+                # Juste avant le "]" final : "[" pour une liste vide, sinon
+                # le "}" qui ferme la dernière entrée
+                last_pos = _last_significant(f, close_pos)
+                f.seek(last_pos)
+                last = f.read(1)
+                empty = last == b"["
+                valid = empty or last == b"}"
+
+        if not valid:
+            if size and head:
+                # Si le fichier est corrompu, on repart à zéro
+                print(f"⚠️ Attention : Le fichier de logs {path} était corrompu. Une nouvelle liste a été créée.")
+            f.truncate(0)
+            f.write(b"[\n" + block)
+            return
+
+        f.truncate(last_pos + 1)
+        f.seek(0, os.SEEK_END)
+        f.write((b"\n" if empty else b",\n") + block)
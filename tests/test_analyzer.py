@@ -18,11 +18,10 @@ from src.tools.sandbox import SandboxManager
 from src.tools.analyzer import PylintAnalyzer, AnalysisResult, Issue
 
 
-@pytest.fixture
-def sandbox_with_code(tmp_path):
-    """Create a sandbox with good and bad Python files."""
-    sandbox_dir = tmp_path / "analyzer_sandbox"
-    sandbox_dir.mkdir()
+@pytest.fixture(scope="module")
+def sandbox_with_code(tmp_path_factory):
+    """Create a sandbox with good and bad Python files (read-only, shared)."""
+    sandbox_dir = tmp_path_factory.mktemp("analyzer_sandbox")
 
     # Clean code (should score high)
     (sandbox_dir / "clean_code.py").write_text(
@@ -95,6 +94,7 @@ class TestAnalysisResult:
         assert d["success"] is True
         assert d["score"] == 7.5
         assert d["issue_count"] == 1
+        assert not hasattr(result.issues[0], "__dict__")
         print(f"  ✅ to_dict: {d}")
 
     def test_is_improved(self):
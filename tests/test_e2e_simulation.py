@@ -16,12 +16,11 @@ Run:  python -m pytest tests/test_e2e_simulation.py -v -s
 """
 import os
 import sys
-import shutil
 import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.tools.sandbox import SandboxManager, initialize_sandbox
+from src.tools.sandbox import SandboxManager
 from src.tools.file_ops import FileOperations
 from src.tools.analyzer import PylintAnalyzer
 from src.tools.tester import PytestRunner
@@ -123,7 +122,7 @@ class TestEndToEndSimulation:
         parser = CodeParser(sandbox)
 
         functions = parser.extract_functions("calculator.py")
-        names = [f.name for f in functions]
+        names = {f.name for f in functions}
         print(f"\n  STEP 3 — Code parsing:")
         print(f"    Functions found: {names}")
         for f in functions:
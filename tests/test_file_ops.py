@@ -15,7 +15,7 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.tools.sandbox import SandboxManager
-from src.tools.file_ops import FileOperations, FileOperationResult
+from src.tools.file_ops import FileOperations
 
 
 @pytest.fixture
@@ -67,6 +67,18 @@ class TestReadFile:
         assert "42" in result.content
         print("  ✅ Read nested file subdir/deep.py")
 
+    def test_read_after_swap_to_outside_symlink(self, sandbox_env, tmp_path):
+        _, file_ops, sandbox_dir = sandbox_env
+        secret = tmp_path / "secret.txt"
+        secret.write_text("topsecret\n")
+        assert file_ops.read_file("sample.py").success is True
+        (sandbox_dir / "sample.py").unlink()
+        (sandbox_dir / "sample.py").symlink_to(secret)
+        result = file_ops.read_file("sample.py")
+        assert result.success is False
+        assert result.content is None or "topsecret" not in result.content
+        print("  ✅ Re-read after a symlink swap is blocked")
+
 
 class TestWriteFile:
     """Test safe (atomic) file writing."""
@@ -87,6 +99,13 @@ class TestWriteFile:
         assert content == "# overwritten\n"
         print("  ✅ Overwrote existing file")
 
+    def test_line_count_independent_of_encoding(self, sandbox_env):
+        _, file_ops, _ = sandbox_env
+        for encoding in ("utf-8", "utf-16", "cp500"):
+            result = file_ops.write_file("enc.py", "a = 1\nb = 2\n", encoding=encoding, create_backup=False)
+            assert result.metadata["line_count"] == 3
+        print("  ✅ line_count counts text lines for utf-8, utf-16 and EBCDIC")
+
     def test_write_creates_backup(self, sandbox_env):
         _, file_ops, sandbox_dir = sandbox_env
         result = file_ops.write_file("sample.py", "# new content\n", create_backup=True)
@@ -126,6 +145,36 @@ class TestListPythonFiles:
         assert result.metadata["count"] >= 3  # sample.py, empty.py, deep.py
         print(f"  ✅ Found {result.metadata['count']} Python files: {[os.path.basename(f) for f in result.metadata['files']]}")
 
+    def test_list_is_sorted_across_directories(self, sandbox_env):
+        _, file_ops, sandbox_dir = sandbox_env
+        (sandbox_dir / "subdir" / "a.py").write_text("")
+        (sandbox_dir / "zz.py").write_text("")
+        (sandbox_dir / "notes.txt").write_text("")
+        files = file_ops.list_python_files().metadata["files"]
+        assert files == sorted(files)
+        assert len(files) == 5
+        print(f"  ✅ Sorted listing: {[os.path.relpath(f, sandbox_dir) for f in files]}")
+
+    def test_missing_or_file_directory_is_empty(self, sandbox_env):
+        _, file_ops, _ = sandbox_env
+        for directory in ("not_created_yet", "sample.py"):
+            result = file_ops.list_python_files(directory)
+            assert result.success is True
+            assert result.metadata == {"files": [], "count": 0}
+        print("  ✅ Missing subdir and file path list as empty")
+
+
+class TestFileExists:
+    """Test the non-throwing existence probe."""
+
+    def test_exists_for_file_only(self, sandbox_env):
+        _, file_ops, _ = sandbox_env
+        assert file_ops.file_exists("sample.py") is True
+        assert file_ops.file_exists("subdir") is False
+        assert file_ops.file_exists("missing.py") is False
+        assert file_ops.file_exists("") is False
+        print("  ✅ file_exists: files True, directories/missing/empty False")
+
 
 class TestFileInfo:
     """Test getting file metadata."""
@@ -138,8 +187,34 @@ class TestFileInfo:
         assert result.metadata["extension"] == ".py"
         print(f"  ✅ File info: size={result.metadata['size_bytes']}B, ext={result.metadata['extension']}")
 
+    def test_timestamps_formatted_on_demand(self, sandbox_env):
+        _, file_ops, _ = sandbox_env
+        result = file_ops.get_file_info("sample.py")
+        assert isinstance(result.metadata["modified_time_ts"], float)
+        assert len(result.modified_time) == 19  # YYYY-MM-DDTHH:MM:SS
+        assert result.modified_time[10] == "T"
+        print(f"  ✅ Modified time: {result.modified_time}")
+
     def test_get_info_missing(self, sandbox_env):
         _, file_ops, _ = sandbox_env
         result = file_ops.get_file_info("nope.py")
         assert result.success is False
         print(f"  ✅ Correctly failed for missing file")
+
+    def test_get_info_outside_sandbox_fails(self, sandbox_env):
+        _, file_ops, _ = sandbox_env
+        result = file_ops.get_file_info("../../etc/passwd")
+        assert result.success is False
+        assert file_ops.file_exists("/etc/passwd") is False
+        print("  ✅ Metadata probes outside the sandbox are rejected")
+
+    def test_symlink_escape_rejected(self, sandbox_env, tmp_path):
+        _, file_ops, sandbox_dir = sandbox_env
+        secret = tmp_path / "secret.txt"
+        secret.write_text("topsecret\n")
+        (sandbox_dir / "link.py").symlink_to(secret)
+        assert file_ops.file_exists("link.py") is False
+        result = file_ops.get_file_info("link.py")
+        assert result.success is False
+        assert "size_bytes" not in result.metadata
+        print("  ✅ Metadata probes do not follow symlinks out of the sandbox")
@@ -15,7 +15,7 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.tools.sandbox import SandboxManager
-from src.tools.function_fixer import FunctionFixer, FixResult
+from src.tools.function_fixer import FunctionFixer, FixResult, LineEditLog, _classify, fix_code, fix_codes
 
 
 @pytest.fixture
@@ -40,6 +40,33 @@ class TestFixMissingDocstring:
         if result.fixes_applied:
             print(f"     Fixed: {result.fixes_applied[0].description}")
 
+    def test_uses_supplied_tree_and_skips_documented(self, fixer_env):
+        import ast
+        code = "async def fetch():\n    return 1\n\nclass Doc:\n\n    'Already documented.'\n"
+        issues = [
+            {"symbol": "missing-docstring", "line": 1, "message": "Missing function docstring"},
+            {"symbol": "missing-docstring", "line": 4, "message": "Missing class docstring"},
+        ]
+        result = fixer_env.fix_code(code, issues, tree=ast.parse(code))
+        assert [f.line_number for f in result.fixes_applied] == [1]
+        assert result.fixes_applied[0].description == "Added docstring to function"
+        print("  ✅ Definitions found via the AST, including async def")
+
+    def test_multiline_decorated_def(self, fixer_env):
+        import ast
+        code = "@staticmethod\ndef build(\n    a,\n    b,\n):\n    return a + b\n"
+        issues = [
+            {"symbol": "missing-docstring", "line": 2, "message": "Missing function docstring"},
+            {"symbol": "too-many-arguments", "line": 2, "message": "Too many arguments"},
+        ]
+        result = fixer_env.fix_code(code, issues)
+        assert len(result.fixes_applied) == 2
+        tree = ast.parse(result.fixed_code)
+        func = tree.body[0]
+        assert ast.get_docstring(func) is not None
+        assert result.fixed_code.startswith("# Consider using a config object")
+        print("  ✅ Docstring placed after a multi-line signature")
+
 
 class TestFixUnusedImport:
     """Test removing unused imports."""
@@ -54,6 +81,39 @@ class TestFixUnusedImport:
         assert result.success is True
         print(f"  ✅ Unused import fix: {len(result.fixes_applied)} fixes applied")
 
+    def test_removes_exact_name_from_from_import(self, fixer_env):
+        code = "if True:\n    from pkg import jsonschema, json as js, json\n"
+        issues = [{"symbol": "unused-import", "line": 2, "message": "Unused import json"}]
+        result = fixer_env.fix_code(code, issues)
+        assert result.fixed_code == "if True:\n    from pkg import jsonschema\n"
+        print("  ✅ Partial from-import removal matches names exactly")
+
+    def test_line_numbers_refer_to_original_code(self, fixer_env):
+        code = "def hello():\n    return 'hi'\nimport os\nimport sys\n"
+        issues = [
+            {"symbol": "missing-docstring", "line": 1, "message": "Missing function docstring"},
+            {"symbol": "unused-import", "line": 3, "message": "Unused import os"},
+            {"symbol": "unused-import", "line": 4, "message": "Unused import sys"},
+        ]
+        result = fixer_env.fix_code(code, issues)
+        assert len(result.fixes_applied) == 3
+        assert "import" not in result.fixed_code
+        assert "return 'hi'" in result.fixed_code
+        print("  ✅ Earlier insertions don't shift later fixes")
+
+
+class TestClassifyLine:
+    """Test keyword classification of source lines."""
+
+    def test_kinds_and_indent(self):
+        assert _classify("    async def run(self):") == ("async_def", 4)
+        assert _classify("def f():") == ("def", 0)
+        assert _classify("  class A:") == ("class", 2)
+        assert _classify("import os") == ("import", 0)
+        assert _classify("\tfrom x import y") == ("from_import", 1)
+        assert _classify("    imported = 1") == ("other", 4)
+        print("  ✅ Lines classified with one lstrip")
+
 
 class TestFixLineTooLong:
     """Test breaking long lines."""
@@ -66,6 +126,51 @@ class TestFixLineTooLong:
         assert result.success is True
         print(f"  ✅ Long line fix: success={result.success}, fixes={len(result.fixes_applied)}")
 
+    def test_split_does_not_shift_later_fixes(self, fixer_env):
+        call = "result = compute(" + ", ".join(f"argument_{i}" for i in range(12)) + ")"
+        code = f"import os\n{call}\nimport sys\nprint(result)\n"
+        issues = [
+            {"symbol": "line-too-long", "line": 2, "message": "Line too long"},
+            {"symbol": "unused-import", "line": 1, "message": "Unused import os"},
+            {"symbol": "unused-import", "line": 3, "message": "Unused import sys"},
+        ]
+        result = fixer_env.fix_code(code, issues)
+        assert sorted(f.line_number for f in result.fixes_applied) == [1, 2, 3]
+        assert "import" not in result.fixed_code
+        assert result.fixed_code.rstrip().endswith("print(result)")
+        assert "argument_11" in result.fixed_code
+        print("  ✅ Line splits keep later issue line numbers valid")
+
+
+class TestFixInvalidName:
+    """Test renaming invalid names."""
+
+    def test_renames_several_names_on_one_line(self, fixer_env):
+        code = "MyValue = OtherValue = 1\nprint(MyValue)\n"
+        issues = [
+            {"symbol": "invalid-name", "line": 1, "message": 'Invalid name "MyValue"'},
+            {"symbol": "invalid-name", "line": 1, "message": 'Invalid name "OtherValue"'},
+            {"symbol": "invalid-name", "line": 1, "message": 'Invalid name "Missing"'},
+        ]
+        result = fixer_env.fix_code(code, issues)
+        assert result.fixed_code == "my_value = other_value = 1\nprint(MyValue)\n"
+        assert [f.description for f in result.fixes_applied] == [
+            "Renamed MyValue to my_value", "Renamed OtherValue to other_value"]
+        print("  ✅ Renames on one line applied in one pass")
+
+    def test_to_snake_case(self):
+        cases = {
+            "MyValue": "my_value",
+            "HTTPServer": "http_server",
+            "getHTTPResponseCode": "get_http_response_code",
+            "value2Go": "value2_go",
+            "already_snake": "already_snake",
+            "ABC": "abc",
+        }
+        for name, expected in cases.items():
+            assert FunctionFixer._to_snake_case(name) == expected
+        print("  ✅ CamelCase → snake_case conversions")
+
 
 class TestSyntaxErrorHandling:
     """Test that the fixer handles unparseable code gracefully."""
@@ -105,3 +210,74 @@ class TestFixResult:
         assert d["success"] is True
         assert d["has_code"] is True
         print(f"  ✅ to_dict: {d}")
+
+
+class TestLazyHelpers:
+    """Test that helpers are only built when used."""
+
+    def test_parser_and_file_ops_built_on_demand(self, fixer_env):
+        fixer_env.fix_code("x = 1\n", [])
+        assert "_parser" not in vars(fixer_env)
+        assert "_file_ops" not in vars(fixer_env)
+        assert fixer_env._parser is fixer_env._parser
+        print("  ✅ CodeParser/FileOperations created lazily and reused")
+
+
+class TestFixCodesBatch:
+    """Test the parallel batch API."""
+
+    def test_matches_sequential_results(self, fixer_env):
+        files = [
+            ("import os\nx = 1\n", [{"symbol": "unused-import", "line": 1, "message": "Unused import os"}]),
+            ("def f():\n    pass\n", [{"symbol": "missing-docstring", "line": 1, "message": "Missing docstring"}]),
+            ("def broken(\n", []),
+        ]
+        results = fix_codes(files, sandbox=fixer_env._sandbox, max_workers=2)
+        expected = [fixer_env.fix_code(code, issues) for code, issues in files]
+        assert [r.fixed_code for r in results] == [e.fixed_code for e in expected]
+        assert [r.success for r in results] == [True, True, False]
+        print("  ✅ fix_codes returns per-file results in input order")
+
+
+class TestModuleLevelFixCode:
+    """Test the fix_code convenience function."""
+
+    def test_reuses_fixer_for_same_sandbox(self, fixer_env, monkeypatch):
+        from src.tools import function_fixer as fixer_module
+        created = []
+        real_init = FunctionFixer.__init__
+        monkeypatch.setattr(FunctionFixer, "__init__",
+                            lambda self, sandbox: created.append(1) or real_init(self, sandbox))
+        monkeypatch.setattr(fixer_module, "_cached_fixer", None)
+        sandbox = fixer_env._sandbox
+        for _ in range(3):
+            assert fix_code("x = 1\n", [], sandbox=sandbox).success
+        assert len(created) == 1
+        print("  ✅ One FunctionFixer shared across fix_code() calls")
+
+
+class TestLineEditLog:
+    """Test deferred line edits."""
+
+    def test_materialize_applies_edits_by_original_index(self):
+        log = LineEditLog(["a\n", "b\n", "c"])
+        log.insert_before(0, "# top")
+        log.delete(1)
+        log.replace(2, "C")
+        log.insert_after(2, "d")
+        assert log.current(1) is None
+        assert log.current(2) == "C"
+        assert log.materialize() == ["# top\n", "a\n", "C\n", "d\n"]
+        print("  ✅ LineEditLog materializes in one pass")
+
+    def test_crlf_line_endings_preserved(self, fixer_env):
+        code = "import os\r\n\r\ndef hello():\r\n    return 'hi'\r\n"
+        issues = [
+            {"symbol": "unused-import", "line": 1, "message": "Unused import os"},
+            {"symbol": "missing-docstring", "line": 3, "message": "Missing function docstring"},
+        ]
+        result = fixer_env.fix_code(code, issues)
+        assert len(result.fixes_applied) == 2
+        assert result.fixed_code.count("\r\n") == result.fixed_code.count("\n")
+        assert result.fixed_code.startswith("\r\ndef hello():\r\n")
+        print("  ✅ CRLF endings survive fixes")
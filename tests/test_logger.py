@@ -15,7 +15,7 @@ import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.utils.logger import log_experiment, ActionType, LOG_FILE
+from src.utils.logger import log_experiment, flush_logs, ActionType, LOG_FILE
 
 
 @pytest.fixture(autouse=True)
@@ -24,6 +24,7 @@ def clean_log_file():
     # Backup existing log
     backup = None
     if os.path.exists(LOG_FILE):
+        flush_logs()
         with open(LOG_FILE, "r") as f:
             backup = f.read()
 
@@ -34,6 +35,9 @@ def clean_log_file():
 
     yield
 
+    # Let queued entries land before restoring
+    flush_logs()
+
     # Restore original log
     if backup is not None:
         with open(LOG_FILE, "w") as f:
@@ -62,6 +66,7 @@ class TestLogExperiment:
             details={"input_prompt": "analyze this", "output_response": "looks good"},
             status="SUCCESS"
         )
+        flush_logs()
         with open(LOG_FILE, "r") as f:
             data = json.load(f)
         assert len(data) == 1
@@ -83,11 +88,84 @@ class TestLogExperiment:
                 details={"input_prompt": f"fix {i}", "output_response": f"fixed {i}"},
                 status="SUCCESS"
             )
+        flush_logs()
         with open(LOG_FILE, "r") as f:
             data = json.load(f)
         assert len(data) == 3
         print(f"  ✅ Logged 3 entries, got {len(data)} in file")
 
+    def test_append_matches_full_rewrite_format(self):
+        """Appending in place leaves the same bytes as dumping the whole list."""
+        for i in range(2):
+            log_experiment(
+                agent_name=f"Agent_{i}",
+                model_used="modèle",
+                action=ActionType.DEBUG,
+                details={"input_prompt": "ligne 1\nligne 2", "output_response": ["ok"]},
+                status="SUCCESS"
+            )
+        flush_logs()
+        with open(LOG_FILE, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert text == json.dumps(json.loads(text), indent=4, ensure_ascii=False)
+        print("  ✅ In-place append keeps the indent=4 JSON list layout")
+
+    def test_background_writer_keeps_order(self):
+        """Entries queued faster than they are written land in call order."""
+        for i in range(50):
+            log_experiment(
+                agent_name=f"Agent_{i}",
+                model_used="model",
+                action=ActionType.ANALYSIS,
+                details={"input_prompt": "x", "output_response": "y"},
+                status="SUCCESS"
+            )
+        flush_logs()
+        with open(LOG_FILE, "r", encoding="utf-8") as f:
+            text = f.read()
+        assert [e["agent"] for e in json.loads(text)] == [f"Agent_{i}" for i in range(50)]
+        assert text == json.dumps(json.loads(text), indent=4, ensure_ascii=False)
+        print("  ✅ 50 queued entries written in order")
+
+    def test_unserializable_entry_raises_and_keeps_neighbours(self):
+        """A bad entry fails in the caller and does not drop queued entries."""
+        def log(i, details):
+            log_experiment(
+                agent_name=f"Agent_{i}",
+                model_used="model",
+                action=ActionType.FIX,
+                details={"input_prompt": "x", "output_response": "y", **details},
+                status="SUCCESS"
+            )
+
+        log(1, {})
+        log(2, {})
+        with pytest.raises(TypeError):
+            log(3, {"extra": object()})
+        log(4, {})
+        flush_logs()
+        with open(LOG_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert [e["agent"] for e in data] == ["Agent_1", "Agent_2", "Agent_4"]
+        print("  ✅ Unserializable entry raised; entries 1, 2 and 4 written")
+
+    def test_details_snapshot_at_call_time(self):
+        """Changing details after the call does not change the logged entry."""
+        details = {"input_prompt": "before", "output_response": "y"}
+        log_experiment(
+            agent_name="Snapshot",
+            model_used="model",
+            action=ActionType.FIX,
+            details=details,
+            status="SUCCESS"
+        )
+        details["input_prompt"] = "after"
+        flush_logs()
+        with open(LOG_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data[-1]["details"]["input_prompt"] == "before"
+        print("  ✅ details logged as they were at call time")
+
     def test_missing_required_fields_raises(self):
         """Missing input_prompt or output_response should raise ValueError."""
         with pytest.raises(ValueError, match="manquants"):
@@ -121,6 +199,7 @@ class TestLogExperiment:
             details={"input_prompt": "x", "output_response": "y"},
             status="SUCCESS"
         )
+        flush_logs()
         with open(LOG_FILE, "r") as f:
             data = json.load(f)
         assert data[-1]["action"] == "FIX"
@@ -143,7 +222,46 @@ class TestCorruptedLogFile:
             details={"input_prompt": "recover", "output_response": "ok"},
             status="SUCCESS"
         )
+        flush_logs()
         with open(LOG_FILE, "r") as f:
             data = json.load(f)
         assert len(data) == 1
         print("  ✅ Recovered from corrupted log file")
+
+    def test_corrupted_last_entry_recovers(self):
+        """A list whose last entry is not a closed object is rewritten."""
+        with open(LOG_FILE, "w") as f:
+            f.write('[\n    {"agent": "Old"},\n    {"agent": \n]')
+
+        log_experiment(
+            agent_name="Recovery",
+            model_used="model",
+            action=ActionType.DEBUG,
+            details={"input_prompt": "recover", "output_response": "ok"},
+            status="SUCCESS"
+        )
+        flush_logs()
+        with open(LOG_FILE, "r") as f:
+            data = json.load(f)
+        assert [e["agent"] for e in data] == ["Recovery"]
+        print("  ✅ Recovered from a truncated last entry")
+
+    def test_corrupted_middle_is_kept(self):
+        """Documented limit: only the frame is checked, not the body."""
+        corrupt = '[\n    {"agent": broken,\n    {"agent": "Old"}\n]'
+        with open(LOG_FILE, "w") as f:
+            f.write(corrupt)
+
+        log_experiment(
+            agent_name="New",
+            model_used="model",
+            action=ActionType.DEBUG,
+            details={"input_prompt": "x", "output_response": "y"},
+            status="SUCCESS"
+        )
+        flush_logs()
+        with open(LOG_FILE, "r") as f:
+            text = f.read()
+        assert text.startswith(corrupt[:-2] + ",\n")
+        assert '"agent": "New"' in text
+        print("  ✅ Corrupt body kept as is, new entry appended")
@@ -10,20 +10,21 @@ Run:  python -m pytest tests/test_parser.py -v
 """
 import os
 import sys
+import shutil
 import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.tools.sandbox import SandboxManager
-from src.tools.parser import CodeParser, FunctionInfo, ClassInfo, ImportInfo, CodeMetrics
+from src.tools.parser import CodeParser, FunctionInfo, ImportInfo, clear_ast_cache, compute_metrics
+from src.tools.parser import functions_from_tree, batch_metrics, parse_files_async, get_imports
 from src.tools.exceptions import ParsingError
 
 
-@pytest.fixture
-def sandbox_with_parseable(tmp_path):
-    """Create a sandbox with various Python files for parsing."""
-    sandbox_dir = tmp_path / "parser_sandbox"
-    sandbox_dir.mkdir()
+@pytest.fixture(scope="module")
+def shared_parseable(tmp_path_factory):
+    """Create a sandbox with various Python files for parsing (read-only, shared)."""
+    sandbox_dir = tmp_path_factory.mktemp("parser_sandbox")
 
     # A rich module with functions, classes, imports
     (sandbox_dir / "rich_module.py").write_text('''"""A module with various constructs."""
@@ -71,67 +72,106 @@ class Dog(Animal):
     return parser, sandbox_dir
 
 
+@pytest.fixture
+def sandbox_with_parseable(shared_parseable, tmp_path):
+    """A private copy of the parser sandbox, for tests that edit its files."""
+    sandbox_dir = tmp_path / "parser_sandbox"
+    shutil.copytree(shared_parseable[1], sandbox_dir)
+    sandbox = SandboxManager(str(sandbox_dir))
+    parser = CodeParser(sandbox)
+    return parser, sandbox_dir
+
+
 class TestExtractFunctions:
     """Test function extraction from AST."""
 
-    def test_finds_all_functions(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_finds_all_functions(self, shared_parseable):
+        parser, _ = shared_parseable
         tree = parser.parse_file("rich_module.py")
         assert tree is not None
 
         # Use the module's extract logic
         functions = parser.extract_functions("rich_module.py")
-        names = [f.name for f in functions]
+        names = {f.name for f in functions}
         assert "simple_function" in names
         assert "no_docstring" in names
         assert "async_handler" in names
         print(f"  ✅ Found {len(functions)} functions: {names}")
 
-    def test_detects_docstrings(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_detects_docstrings(self, shared_parseable):
+        parser, _ = shared_parseable
         functions = parser.extract_functions("rich_module.py")
         func_map = {f.name: f for f in functions}
         assert func_map["simple_function"].has_docstring is True
         assert func_map["no_docstring"].has_docstring is False
         print("  ✅ Docstring detection works")
 
-    def test_detects_async(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_detects_async(self, shared_parseable):
+        parser, _ = shared_parseable
         functions = parser.extract_functions("rich_module.py")
         func_map = {f.name: f for f in functions}
         assert func_map["async_handler"].is_async is True
         assert func_map["simple_function"].is_async is False
         print("  ✅ Async detection works")
 
-    def test_extracts_parameters(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_extracts_parameters(self, shared_parseable):
+        parser, _ = shared_parseable
         functions = parser.extract_functions("rich_module.py")
         func_map = {f.name: f for f in functions}
         assert "x" in func_map["simple_function"].parameters
         assert "y" in func_map["simple_function"].parameters
         print(f"  ✅ Parameters: {func_map['simple_function'].parameters}")
 
+    def test_fields_skips_unrequested_lists(self, shared_parseable):
+        parser, _ = shared_parseable
+        full = parser.extract_functions("rich_module.py")
+        slim = parser.extract_functions("rich_module.py", wanted={"name"})
+        assert [(f.name, f.line_number, f.has_docstring) for f in slim] == \
+            [(f.name, f.line_number, f.has_docstring) for f in full]
+        assert all(f.parameters == [] and f.decorators == [] for f in slim)
+        with_params = parser.extract_functions("rich_module.py", wanted={"parameters"})
+        assert [f.parameters for f in with_params] == [f.parameters for f in full]
+        print("  ✅ wanted= limits which lists are built")
+
+    def test_module_function_memoized_per_file_version(self, sandbox_with_parseable, monkeypatch):
+        from src.tools import parser as parser_module
+        parser, sandbox_dir = sandbox_with_parseable
+        clear_ast_cache()
+        extractions = []
+        real_extract = parser_module._extract
+        monkeypatch.setattr(parser_module, "_extract",
+                            lambda *a: extractions.append(a[0]) or real_extract(*a))
+        (sandbox_dir / "small.py").write_text("def a():\n    pass\n")
+        first = parser_module.extract_functions("small.py", sandbox=parser._sandbox)
+        second = parser_module.extract_functions("small.py", sandbox=parser._sandbox)
+        assert extractions == ["functions"]
+        assert first == second and first is not second
+        (sandbox_dir / "small.py").write_text("def a():\n    pass\n\ndef b():\n    pass\n")
+        names = [f.name for f in parser_module.extract_functions("small.py", sandbox=parser._sandbox)]
+        assert names == ["a", "b"]
+        print("  ✅ extract_functions() reuses results until the file changes")
+
 
 class TestExtractClasses:
     """Test class extraction from AST."""
 
-    def test_finds_all_classes(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_finds_all_classes(self, shared_parseable):
+        parser, _ = shared_parseable
         classes = parser.extract_classes("rich_module.py")
-        names = [c.name for c in classes]
+        names = {c.name for c in classes}
         assert "Animal" in names
         assert "Dog" in names
         print(f"  ✅ Found {len(classes)} classes: {names}")
 
-    def test_detects_base_classes(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_detects_base_classes(self, shared_parseable):
+        parser, _ = shared_parseable
         classes = parser.extract_classes("rich_module.py")
         cls_map = {c.name: c for c in classes}
         assert "Animal" in cls_map["Dog"].base_classes
         print(f"  ✅ Dog inherits from: {cls_map['Dog'].base_classes}")
 
-    def test_lists_methods(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_lists_methods(self, shared_parseable):
+        parser, _ = shared_parseable
         classes = parser.extract_classes("rich_module.py")
         cls_map = {c.name: c for c in classes}
         assert "speak" in cls_map["Animal"].methods
@@ -142,8 +182,8 @@ class TestExtractClasses:
 class TestExtractImports:
     """Test import extraction."""
 
-    def test_finds_imports(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_finds_imports(self, shared_parseable):
+        parser, _ = shared_parseable
         imports = parser.extract_imports("rich_module.py")
         modules = [i.module for i in imports]
         assert "os" in modules
@@ -151,25 +191,323 @@ class TestExtractImports:
         assert "pathlib" in modules
         print(f"  ✅ Found {len(imports)} imports: {modules}")
 
+    def test_get_imports_matches_extract_imports(self, shared_parseable):
+        parser, _ = shared_parseable
+        modules = get_imports("rich_module.py", sandbox=parser._sandbox)
+        assert modules == [i.module for i in parser.extract_imports("rich_module.py") if i.module]
+        print(f"  ✅ get_imports without ImportInfo objects: {modules}")
+
+
+class TestDiskAstCache:
+    """Test the opt-in persistent AST cache."""
+
+    def test_warm_run_loads_from_disk(self, shared_parseable, tmp_path, monkeypatch):
+        import ast
+        from src.tools import parser as parser_module
+        parser, _ = shared_parseable
+        cache_dir = tmp_path / "ast_cache"
+        monkeypatch.setenv("RSWARM_AST_CACHE", "1")
+        monkeypatch.setenv("RSWARM_AST_CACHE_DIR", str(cache_dir))
+        clear_ast_cache()
+        cold = parser.parse_file("rich_module.py")
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+        clear_ast_cache()
+        def no_parse(*args, **kwargs):
+            raise AssertionError("ast.parse should not run on a warm cache")
+        monkeypatch.setattr(parser_module.ast, "parse", no_parse)
+        warm = parser.parse_file("rich_module.py")
+        assert ast.dump(warm) == ast.dump(cold)
+        clear_ast_cache()
+        print("  ✅ Warm parse served from the on-disk cache")
+
+    def test_disabled_by_default(self, shared_parseable, tmp_path, monkeypatch):
+        parser, _ = shared_parseable
+        monkeypatch.delenv("RSWARM_AST_CACHE", raising=False)
+        monkeypatch.setenv("RSWARM_AST_CACHE_DIR", str(tmp_path / "unused"))
+        clear_ast_cache()
+        parser.parse_file("rich_module.py")
+        assert not (tmp_path / "unused").exists()
+        print("  ✅ No disk cache unless RSWARM_AST_CACHE=1")
+
+
+class TestInfoSerialization:
+    """Test the slotted info dataclasses."""
+
+    def test_to_dict_follows_field_order(self):
+        info = ImportInfo(module="os", line_number=3, names=["path"], is_from_import=True)
+        assert info.to_dict() == {"module": "os", "line_number": 3, "names": ["path"],
+                                  "alias": None, "is_from_import": True}
+        assert list(FunctionInfo(name="f", line_number=1).to_dict()) == [
+            "name", "line_number", "parameters", "has_docstring", "is_async", "decorators"]
+        assert not hasattr(info, "__dict__")
+        print("  ✅ to_dict driven by cached field names")
+
+
+class TestExtractAll:
+    """Test the combined single-walk extractor."""
+
+    def test_matches_individual_extractors(self, shared_parseable):
+        parser, _ = shared_parseable
+        functions, classes, imports = parser.extract_all("rich_module.py")
+        assert functions == parser.extract_functions("rich_module.py")
+        assert classes == parser.extract_classes("rich_module.py")
+        assert imports == parser.extract_imports("rich_module.py")
+        print(f"  ✅ extract_all: {len(functions)} functions, {len(classes)} classes, {len(imports)} imports")
+
+
+class TestStatementWalk:
+    """Test the statement-only traversal used by the extractors."""
+
+    def test_same_definitions_as_ast_walk(self):
+        import ast
+        from src.tools.parser import _iter_statements
+        code = (
+            "try:\n    import a\nexcept ImportError:\n    import b\nelse:\n    pass\n"
+            "def f(x):\n    match x:\n        case 1:\n            from c import d\n"
+            "    with open(x) as fh:\n        class Inner:\n            def m(self): pass\n"
+            "g = lambda: [i for i in range(3)]\n"
+        )
+        tree = ast.parse(code)
+        kinds = (ast.FunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom)
+        expected = [n for n in ast.walk(tree) if isinstance(n, kinds)]
+        assert [n for n in _iter_statements(tree) if isinstance(n, kinds)] == expected
+        assert not any(isinstance(n, ast.expr) for n in _iter_statements(tree))
+        print("  ✅ Statement walk matches ast.walk without entering expressions")
+
+
+class TestAstCache:
+    """Test the content-keyed AST cache."""
+
+    def test_same_content_reuses_tree(self, shared_parseable):
+        parser, _ = shared_parseable
+        clear_ast_cache()
+        first = parser.parse_file("rich_module.py")
+        assert parser.parse_file("rich_module.py") is first
+        clear_ast_cache()
+        assert parser.parse_file("rich_module.py") is not first
+        print("  ✅ Unchanged file parsed once; clear_ast_cache() forces a re-parse")
+
+    def test_changed_content_reparses(self, sandbox_with_parseable):
+        parser, sandbox_dir = sandbox_with_parseable
+        first = parser.parse_file("rich_module.py")
+        (sandbox_dir / "rich_module.py").write_text("x = 1\n")
+        second = parser.parse_file("rich_module.py")
+        assert second is not first
+        assert len(second.body) == 1
+        print("  ✅ Edited file re-parsed")
+
+    def test_unchanged_file_not_reread(self, shared_parseable, monkeypatch):
+        from src.tools import parser as parser_module
+        parser, _ = shared_parseable
+        clear_ast_cache()
+        reads = []
+        real_parse = parser_module._parse_cached
+        monkeypatch.setattr(parser_module, "_parse_cached",
+                            lambda content, **kw: reads.append(type(content)) or real_parse(content, **kw))
+        first = parser.parse_file("rich_module.py")
+        assert parser.parse_file("rich_module.py") is first
+        parser.extract_classes("rich_module.py")
+        assert reads == [bytes]
+        print("  ✅ Same mtime/size: file read once, as bytes")
+
+    def test_non_utf8_file_falls_back_to_text_read(self, sandbox_with_parseable):
+        parser, sandbox_dir = sandbox_with_parseable
+        (sandbox_dir / "latin.py").write_bytes(b"name = '\xe9t\xe9'\n")
+        tree = parser.parse_file("latin.py")
+        assert tree.body[0].value.value == "\xe9t\xe9"
+        print("  ✅ Non-UTF-8 source still parsed via the latin-1 read")
+
+    def test_bytes_and_text_cached_separately(self, sandbox_with_parseable):
+        """A BOM is valid in file bytes but not in text; call order must not matter."""
+        parser, sandbox_dir = sandbox_with_parseable
+        (sandbox_dir / "bom.py").write_bytes(b"\xef\xbb\xbfx = 1\n")
+        for first_metrics in (True, False):
+            clear_ast_cache()
+            if first_metrics:
+                parser.get_code_metrics("bom.py")
+            assert parser.find_syntax_errors("bom.py") == []
+            parser.get_code_metrics("bom.py")
+        print("  ✅ BOM file: syntax check independent of call order")
+
+    def test_syntax_errors_cached(self, monkeypatch):
+        import ast
+        from src.tools import parser as parser_module
+        clear_ast_cache()
+        calls = []
+        real_parse = ast.parse
+        monkeypatch.setattr(parser_module.ast, "parse",
+                            lambda *a, **kw: calls.append(1) or real_parse(*a, **kw))
+        for name in ("a.py", "b.py"):
+            with pytest.raises(SyntaxError) as info:
+                parser_module._parse_cached("def broken(:\n", filename=name)
+            assert info.value.filename == name
+            assert info.value.lineno == 1
+        assert len(calls) == 1
+        print("  ✅ Broken source parsed once, error replayed")
+
+
+class TestIncrementalParse:
+    """Test tree-sitter incremental parsing and its ast fallback."""
+
+    def test_falls_back_to_ast_without_tree_sitter(self, shared_parseable, monkeypatch):
+        import ast
+        from src.tools import parser as parser_module
+        parser, _ = shared_parseable
+        monkeypatch.setattr(parser_module, "_ts_python", None)
+        tree = parser.parse_file_incremental("rich_module.py")
+        assert isinstance(tree, ast.Module)
+        assert functions_from_tree(tree) == parser.extract_functions("rich_module.py")
+        print("  ✅ Without tree-sitter: ast.Module returned")
+
+    def test_reparse_after_edit_matches_ast(self, sandbox_with_parseable):
+        pytest.importorskip("tree_sitter_python")
+        parser, sandbox_dir = sandbox_with_parseable
+        tree = parser.parse_file_incremental("rich_module.py")
+        assert functions_from_tree(tree) == parser.extract_functions("rich_module.py")
+
+        path = sandbox_dir / "rich_module.py"
+        old = path.read_bytes()
+        start = old.index(b"def no_docstring(a):")
+        insert = b"def added(p, q=1):\n    return p\n\n"
+        path.write_bytes(old[:start] + insert + old[start:])
+        row = old[:start].count(b"\n")
+        tree = parser.parse_file_incremental("rich_module.py", tree, {
+            "start_byte": start, "old_end_byte": start, "new_end_byte": start + len(insert),
+            "start_point": (row, 0), "old_end_point": (row, 0), "new_end_point": (row + 3, 0),
+        })
+        functions = functions_from_tree(tree)
+        assert functions == parser.extract_functions("rich_module.py")
+        assert any(f.name == "added" and f.parameters == ["p", "q"] for f in functions)
+        print(f"  ✅ Incremental re-parse found {len(functions)} functions")
+
+    def test_tree_sitter_order_matches_ast(self, sandbox_with_parseable):
+        pytest.importorskip("tree_sitter_python")
+        parser, sandbox_dir = sandbox_with_parseable
+        (sandbox_dir / "nested.py").write_text(
+            "@wrap\ndef top():\n    def inner():\n        pass\n\n"
+            "class C:\n    @property\n    def prop(self):\n        pass\n\n"
+            "if a:\n    def one():\n        pass\nelif b:\n    def two():\n        pass\n"
+            "else:\n    def three():\n        pass\n\n"
+            "try:\n    def t():\n        pass\nexcept E:\n    def h():\n        pass\n\n"
+            "def last():\n    pass\n"
+        )
+        tree = parser.parse_file_incremental("nested.py")
+        assert functions_from_tree(tree) == parser.extract_functions("nested.py")
+        print("  ✅ tree-sitter functions come back in the same order as ast")
+
 
 class TestSyntaxErrorHandling:
     """Test behavior with unparseable files."""
 
-    def test_syntax_error_raises(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_syntax_error_raises(self, shared_parseable):
+        parser, _ = shared_parseable
         with pytest.raises(ParsingError):
             parser.parse_file("syntax_error.py")
         print("  ✅ Syntax error correctly raises ParsingError")
 
+    def test_syntax_error_file_read_once(self, shared_parseable, monkeypatch):
+        from src.tools import parser as parser_module
+        parser, _ = shared_parseable
+        clear_ast_cache()
+        opens = []
+        monkeypatch.setattr(parser_module, "open",
+                            lambda *a, **kw: opens.append(a[0]) or open(*a, **kw), raising=False)
+        monkeypatch.setattr(parser_module, "read_file",
+                            lambda *a, **kw: pytest.fail("file read again"))
+        with pytest.raises(ParsingError) as exc_info:
+            parser.parse_file("syntax_error.py")
+        assert len(opens) == 1
+        assert exc_info.value.context["code_snippet"].startswith("def broken(")
+        assert exc_info.value.context["line_number"] == 1
+        print("  ✅ Syntax error reported from a single read")
+
+    def test_parse_cache_does_not_keep_sandbox(self, shared_parseable, tmp_path):
+        import gc
+        import weakref
+        _, source_dir = shared_parseable
+        sandbox_dir = tmp_path / "short_lived"
+        shutil.copytree(source_dir, sandbox_dir)
+        sandbox = SandboxManager(str(sandbox_dir))
+        CodeParser(sandbox).parse_file("rich_module.py")
+        ref = weakref.ref(sandbox)
+        del sandbox
+        gc.collect()
+        assert ref() is None
+        print("  ✅ Parse cache does not keep the sandbox alive")
+
+
+class TestParseFilesAsync:
+    """Test the async bulk parser."""
+
+    def test_parses_batch_and_reports_failures(self, shared_parseable):
+        import ast
+        import asyncio
+        parser, _ = shared_parseable
+        paths = ["rich_module.py", "syntax_error.py", "missing.py"]
+        results = asyncio.run(parse_files_async(paths, sandbox=parser._sandbox, concurrency=2))
+        assert list(results) == paths
+        assert ast.dump(results["rich_module.py"]) == ast.dump(parser.parse_file("rich_module.py"))
+        assert isinstance(results["syntax_error.py"], ParsingError)
+        assert isinstance(results["missing.py"], ParsingError)
+        print("  ✅ parse_files_async: trees for good files, ParsingError for bad ones")
+
 
 class TestCodeMetrics:
     """Test code metrics calculation."""
 
-    def test_metrics_computed(self, sandbox_with_parseable):
-        parser, _ = sandbox_with_parseable
+    def test_metrics_computed(self, shared_parseable):
+        parser, _ = shared_parseable
         metrics = parser.get_code_metrics("rich_module.py")
         assert metrics.total_lines > 0
         assert metrics.function_count >= 3
         assert metrics.class_count >= 2
         assert metrics.import_count >= 3
         print(f"  ✅ Metrics: {metrics.to_dict()}")
+
+    def test_metrics_read_file_once(self, shared_parseable, monkeypatch):
+        from src.tools import parser as parser_module
+        parser, _ = shared_parseable
+        clear_ast_cache()
+        reads = []
+        real_read = parser_module.read_file
+        monkeypatch.setattr(parser_module, "read_file",
+                            lambda *a, **kw: reads.append(1) or real_read(*a, **kw))
+        metrics = parser.get_code_metrics("rich_module.py")
+        assert metrics.function_count == 7
+        assert len(reads) == 1
+        print("  ✅ get_code_metrics: one read, one parse")
+
+    def test_metrics_for_syntax_error_file(self, shared_parseable):
+        parser, _ = shared_parseable
+        metrics = parser.get_code_metrics("syntax_error.py")
+        assert metrics.total_lines == 3
+        assert metrics.function_count == 0
+        print("  ✅ Unparseable file still gets line metrics")
+
+    def test_compute_metrics_matches_source(self):
+        import ast
+        code = "import os, sys\nfrom x import a, b\n\n# note\nclass A:\n    async def f(self):\n        pass\n"
+        metrics = compute_metrics(ast.parse(code), code)
+        assert metrics.total_lines == 8
+        assert metrics.comment_lines == 1
+        assert metrics.code_lines == 5
+        assert (metrics.function_count, metrics.class_count, metrics.import_count) == (1, 1, 3)
+        assert metrics.max_line_length == len("    async def f(self):")
+        print(f"  ✅ compute_metrics: {metrics.to_dict()}")
+
+    def test_compute_metrics_without_line_scan(self):
+        code = "# c\nx = 1\n"
+        metrics = compute_metrics(None, code, line_metrics=False)
+        assert metrics.total_lines == 3
+        assert (metrics.code_lines, metrics.comment_lines, metrics.max_line_length) == (0, 0, 0)
+        print("  ✅ line_metrics=False: only the newline count")
+
+    def test_batch_metrics_matches_sequential(self, shared_parseable):
+        parser, _ = shared_parseable
+        paths = ["rich_module.py", "syntax_error.py"]
+        results = batch_metrics(paths, sandbox=parser._sandbox, max_workers=2)
+        assert list(results) == paths
+        for path in paths:
+            assert results[path].to_dict() == parser.get_code_metrics(path).to_dict()
+        print("  ✅ batch_metrics matches per-file get_code_metrics")
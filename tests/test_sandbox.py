@@ -10,29 +10,37 @@ Run:  python -m pytest tests/test_sandbox.py -v
 """
 import os
 import sys
-import tempfile
-import shutil
 import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.tools.sandbox import SandboxManager, initialize_sandbox, get_sandbox, get_safe_path
+from src.tools.sandbox import SandboxManager, initialize_sandbox, get_sandbox
 from src.tools.exceptions import SecurityError
 
 
-@pytest.fixture
-def tmp_sandbox(tmp_path):
-    """Create a temporary sandbox directory for testing."""
-    sandbox_dir = tmp_path / "test_sandbox"
-    sandbox_dir.mkdir()
-    # Create some test files inside
+def _populate(sandbox_dir):
+    """Create some test files inside a sandbox directory."""
     (sandbox_dir / "good_file.py").write_text("print('hello')")
     (sandbox_dir / "subdir").mkdir()
     (sandbox_dir / "subdir" / "nested.py").write_text("x = 1")
     return SandboxManager(str(sandbox_dir))
 
 
+@pytest.fixture(scope="module")
+def shared_sandbox(tmp_path_factory):
+    """One sandbox for the whole module, for tests that only read from it."""
+    return _populate(tmp_path_factory.mktemp("shared_sandbox"))
+
+
+@pytest.fixture
+def tmp_sandbox(tmp_path):
+    """A fresh sandbox for tests that write files or inspect its cache."""
+    sandbox_dir = tmp_path / "test_sandbox"
+    sandbox_dir.mkdir()
+    return _populate(sandbox_dir)
+
+
 class TestSandboxCreation:
     """Test sandbox initialization."""
 
@@ -44,10 +52,10 @@ class TestSandboxCreation:
         assert new_dir.exists()
         print(f"  ✅ Created sandbox at: {sandbox.sandbox_root}")
 
-    def test_sandbox_root_is_absolute(self, tmp_sandbox):
+    def test_sandbox_root_is_absolute(self, shared_sandbox):
         """sandbox_root should always be an absolute path."""
-        assert tmp_sandbox.sandbox_root.is_absolute()
-        print(f"  ✅ Sandbox root is absolute: {tmp_sandbox.sandbox_root}")
+        assert shared_sandbox.sandbox_root.is_absolute()
+        print(f"  ✅ Sandbox root is absolute: {shared_sandbox.sandbox_root}")
 
     def test_empty_path_raises(self):
         """Empty sandbox path should raise ValueError."""
@@ -59,56 +67,101 @@ class TestSandboxCreation:
 class TestPathValidation:
     """Test that validate_path blocks dangerous paths and allows safe ones."""
 
-    def test_valid_relative_path(self, tmp_sandbox):
+    def test_valid_relative_path(self, shared_sandbox):
         """A relative path to an existing file should be validated."""
-        result = tmp_sandbox.validate_path("good_file.py")
+        result = shared_sandbox.validate_path("good_file.py")
         assert result.exists()
         print(f"  ✅ Validated: good_file.py → {result}")
 
-    def test_valid_nested_path(self, tmp_sandbox):
+    def test_valid_nested_path(self, shared_sandbox):
         """Nested relative paths should work."""
-        result = tmp_sandbox.validate_path("subdir/nested.py")
+        result = shared_sandbox.validate_path("subdir/nested.py")
         assert result.exists()
         print(f"  ✅ Validated nested: subdir/nested.py → {result}")
 
-    def test_traversal_attack_blocked(self, tmp_sandbox):
-        """Path traversal with ../ must be blocked."""
+    @pytest.mark.parametrize("bad_path", [
+        "../../etc/passwd",          # Traversal with ../
+        "subdir/../../escape.py",    # Traversal through a real subfolder
+        "/etc/passwd",               # Absolute path outside the sandbox
+        "/proc/self/environ",
+    ])
+    def test_unsafe_path_blocked(self, shared_sandbox, bad_path):
+        """Traversal and absolute paths outside the sandbox must be blocked."""
         with pytest.raises(SecurityError):
-            tmp_sandbox.validate_path("../../etc/passwd")
-        print("  ✅ Blocked path traversal: ../../etc/passwd")
-
-    def test_absolute_path_outside_blocked(self, tmp_sandbox):
-        """Absolute paths outside sandbox must be blocked."""
+            shared_sandbox.validate_path(bad_path)
+        print(f"  ✅ Blocked path outside sandbox: {bad_path}")
+
+    def test_symlink_escape_blocked(self, tmp_sandbox, tmp_path):
+        """A symlink inside the sandbox must not lead outside it."""
+        outside = tmp_path / "outside.py"
+        outside.write_text("secret = 1")
+        os.symlink(outside, tmp_sandbox.sandbox_root / "link.py")
+        with pytest.raises(SecurityError):
+            tmp_sandbox.validate_path("link.py")
+        print("  ✅ Blocked symlink pointing outside the sandbox")
+
+    def test_file_swapped_for_symlink_after_check(self, tmp_sandbox, tmp_path):
+        """A path validated once must be re-checked if it becomes a link."""
+        outside = tmp_path / "outside.py"
+        outside.write_text("topsecret\n")
+        assert tmp_sandbox.validate_path("good_file.py")
+        assert tmp_sandbox.is_safe("good_file.py") is True
+        target = tmp_sandbox.sandbox_root / "good_file.py"
+        target.unlink()
+        target.symlink_to(outside)
         with pytest.raises(SecurityError):
-            tmp_sandbox.validate_path("/etc/passwd")
-        print("  ✅ Blocked absolute path outside sandbox: /etc/passwd")
+            tmp_sandbox.validate_path("good_file.py")
+        assert tmp_sandbox.is_safe("good_file.py") is False
+        print("  ✅ Symlink swapped in after validation is still blocked")
 
-    def test_empty_path_raises(self, tmp_sandbox):
+    def test_empty_path_raises(self, shared_sandbox):
         """Empty path should raise ValueError."""
         with pytest.raises(ValueError):
-            tmp_sandbox.validate_path("")
+            shared_sandbox.validate_path("")
         print("  ✅ Empty path correctly rejected")
 
+    def test_results_cached_per_instance(self, tmp_sandbox, tmp_path):
+        """Repeat validations hit the cache; other sandboxes are unaffected."""
+        first = tmp_sandbox.validate_path("good_file.py")
+        assert tmp_sandbox.validate_path("good_file.py") == first
+        assert tmp_sandbox._normalize_cached.cache_info().hits == 1
+        other = SandboxManager(str(tmp_path / "other_sandbox"))
+        assert other.validate_path("good_file.py") != first
+        tmp_sandbox.cleanup(preserve_structure=True)
+        assert tmp_sandbox._normalize_cached.cache_info().currsize == 0
+        print("  ✅ validate_path cached per sandbox, cleared by cleanup()")
+
 
 class TestIsSafe:
     """Test the non-throwing is_safe() method."""
 
-    def test_safe_path_returns_true(self, tmp_sandbox):
-        result = tmp_sandbox.is_safe("good_file.py")
+    def test_safe_path_returns_true(self, shared_sandbox):
+        result = shared_sandbox.is_safe("good_file.py")
         assert result is True
         print("  ✅ is_safe('good_file.py') = True")
 
-    def test_dangerous_path_returns_false(self, tmp_sandbox):
-        result = tmp_sandbox.is_safe("../../etc/shadow")
+    @pytest.mark.parametrize("bad_path", ["../../etc/shadow", "/etc/shadow"])
+    def test_dangerous_path_returns_false(self, shared_sandbox, bad_path):
+        result = shared_sandbox.is_safe(bad_path)
         assert result is False
-        print("  ✅ is_safe('../../etc/shadow') = False")
+        print(f"  ✅ is_safe('{bad_path}') = False")
+
+    def test_shares_cache_with_validate_path(self, tmp_sandbox):
+        assert tmp_sandbox.is_safe("good_file.py") is True
+        assert tmp_sandbox.is_safe("../../etc/shadow") is False
+        tmp_sandbox.validate_path("good_file.py")
+        with pytest.raises(SecurityError):
+            tmp_sandbox.validate_path("../../etc/shadow")
+        info = tmp_sandbox._normalize_cached.cache_info()
+        assert (info.hits, info.misses) == (2, 2)
+        print("  ✅ is_safe and validate_path share one validation per path")
 
 
 class TestGetSafePath:
     """Test the convenience get_safe_path method."""
 
-    def test_constructs_safe_path(self, tmp_sandbox):
-        result = tmp_sandbox.get_safe_path("good_file.py")
+    def test_constructs_safe_path(self, shared_sandbox):
+        result = shared_sandbox.get_safe_path("good_file.py")
         assert str(result).endswith("good_file.py")
         assert result.is_absolute()
         print(f"  ✅ get_safe_path → {result}")
@@ -117,14 +170,29 @@ class TestGetSafePath:
 class TestListPythonFiles:
     """Test listing Python files in sandbox."""
 
-    def test_finds_all_python_files(self, tmp_sandbox):
-        files = tmp_sandbox.list_python_files()
-        names = [f.name for f in files]
+    def test_finds_all_python_files(self, shared_sandbox):
+        files = shared_sandbox.list_python_files()
+        names = {f.name for f in files}
         assert "good_file.py" in names
         assert "nested.py" in names
         print(f"  ✅ Found {len(files)} Python files: {names}")
 
 
+class TestCleanup:
+    """Test removing sandbox contents."""
+
+    def test_preserve_structure_keeps_directories(self, tmp_sandbox, tmp_path):
+        outside = tmp_path / "outside.py"
+        outside.write_text("x = 2")
+        (tmp_sandbox.sandbox_root / "link.py").symlink_to(outside)
+        tmp_sandbox.cleanup(preserve_structure=True)
+        root = tmp_sandbox.sandbox_root
+        assert (root / "subdir").is_dir()
+        assert list(root.rglob("*")) == [root / "subdir"]
+        assert outside.exists()  # Only the link is removed, not its target
+        print("  ✅ cleanup(preserve_structure=True) removed files, kept folders")
+
+
 class TestGlobalSandbox:
     """Test module-level initialize/get functions."""
 
@@ -135,3 +203,12 @@ class TestGlobalSandbox:
         retrieved = get_sandbox()
         assert sandbox.sandbox_root == retrieved.sandbox_root
         print(f"  ✅ Global sandbox init & retrieval works")
+
+    def test_reinitialize_replaces_global(self, tmp_path):
+        from src.tools import get_sandbox as package_get_sandbox
+        first = initialize_sandbox(str(tmp_path / "first"))
+        assert get_sandbox() is first
+        second = initialize_sandbox(str(tmp_path / "second"))
+        assert get_sandbox() is second
+        assert package_get_sandbox() is second
+        print(f"  ✅ get_sandbox follows re-initialization")
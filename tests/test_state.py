@@ -10,7 +10,6 @@ Run:  python -m pytest tests/test_state.py -v
 """
 import os
 import sys
-import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
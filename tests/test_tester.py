@@ -85,6 +85,91 @@ class TestFailingTests:
         for ft in result.failed_tests:
             print(f"     FAILED: {ft.test_name} — {ft.error_message}")
 
+    def test_failure_details_from_report(self, sandbox_with_tests):
+        runner, _ = sandbox_with_tests
+        result = runner.run_tests("test_failing.py")
+        assert result.stats == {"total": 2, "passed": 0, "failed": 2, "skipped": 0, "errors": 0}
+        failed = result.failed_tests[0]
+        assert failed.test_name == "test_multiply_positive"
+        assert failed.test_file == "test_failing.py"
+        assert failed.line_number == 3
+        assert "assert 7 == 12" in failed.error_message
+        assert "multiply(3, 4)" in failed.traceback
+        print(f"  ✅ Failure details from JUnit report: {failed.test_file}:{failed.line_number}")
+
+
+class TestInProcess:
+    """Test running Pytest inside the current interpreter."""
+
+    def test_matches_subprocess_and_sees_edits(self, sandbox_with_tests):
+        runner, sandbox_dir = sandbox_with_tests
+        in_process = PytestRunner(runner._sandbox, in_process=True)
+        result = in_process.run_tests("test_failing.py")
+        assert result.stats == runner.run_tests("test_failing.py").stats
+        assert result.failed_tests[0].test_file == "test_failing.py"
+        assert "buggy_module" not in sys.modules
+
+        (sandbox_dir / "buggy_module.py").write_text("def multiply(a, b):\n    return a * b\n")
+        assert in_process.run_tests("test_failing.py").all_tests_passed is True
+        print(f"  ✅ In-process run matches subprocess and reloads edited modules")
+
+    def test_keeps_modules_from_outside_sandbox(self, sandbox_with_tests):
+        runner, sandbox_dir = sandbox_with_tests
+        (sandbox_dir / "test_stdlib.py").write_text(
+            "import colorsys\n\ndef test_uses_stdlib():\n    assert colorsys.rgb_to_hsv(0, 0, 0)[2] == 0\n"
+        )
+        sys.modules.pop("colorsys", None)
+        in_process = PytestRunner(runner._sandbox, in_process=True)
+        assert in_process.run_tests("test_stdlib.py").all_tests_passed is True
+        assert "colorsys" in sys.modules
+        assert "test_stdlib" not in sys.modules
+        print(f"  ✅ In-process run only unloads modules from the sandbox")
+
+    def test_same_cwd_and_rootdir_as_subprocess(self, sandbox_with_tests):
+        runner, sandbox_dir = sandbox_with_tests
+        (sandbox_dir / "data.txt").write_text("payload")
+        (sandbox_dir / "test_relative.py").write_text(
+            "import os\n\n"
+            "def test_relative_read():\n    assert open('data.txt').read() == 'payload'\n\n"
+            f"def test_rootdir(request):\n    assert str(request.config.rootpath) == {str(sandbox_dir)!r}\n"
+        )
+        cwd = os.getcwd()
+        in_process = PytestRunner(runner._sandbox, in_process=True)
+        for mode in (runner, in_process):
+            result = mode.run_tests("test_relative.py")
+            assert result.all_tests_passed is True
+            assert result.stats["passed"] == 2
+        assert os.getcwd() == cwd
+        print(f"  ✅ Relative paths and rootdir agree in both modes")
+
+
+class TestConsoleFallback:
+    """Test the console-output parser used when no report is written."""
+
+    def test_parses_summary_and_failed_lines(self, sandbox_with_tests):
+        runner, _ = sandbox_with_tests
+        output = (
+            "FAILED tests/test_m.py::test_mul - AssertionError: assert 7 == 12\n"
+            "========= 1 failed, 3 passed, 1 skipped in 0.12s =========\n"
+        )
+        stats, failed = runner._parse_output(output)
+        assert stats == {"total": 5, "passed": 3, "failed": 1, "skipped": 1, "errors": 0}
+        assert (failed[0].test_file, failed[0].test_name, failed[0].error_type) == \
+            ("tests/test_m.py", "test_mul", "AssertionError")
+        print(f"  ✅ Console fallback: {stats}")
+
+    def test_summary_line_split_and_regex_fallback(self, sandbox_with_tests):
+        runner, _ = sandbox_with_tests
+        output = (
+            "FAILED test_m.py::test_mul - AssertionError: 9 passed expected\n"
+            "==== 1 failed, 2 passed, 2 errors, 1 warning in 0.12s ====\n"
+        )
+        stats, _ = runner._parse_output(output)
+        assert stats == {"total": 5, "passed": 2, "failed": 1, "skipped": 0, "errors": 2}
+        stats, _ = runner._parse_output("3 passed, 1 skipped\n(no trailing summary)\n")
+        assert (stats["passed"], stats["skipped"], stats["total"]) == (3, 1, 4)
+        print(f"  ✅ Summary line split, regex fallback for other layouts")
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -95,6 +180,45 @@ class TestEdgeCases:
         assert result.success is False
         print(f"  ✅ Missing file handled: {result.error}")
 
+    def test_undecodable_output_kills_child(self, sandbox_with_tests, monkeypatch):
+        import subprocess
+        from src.tools import tester as tester_module
+        runner, _ = sandbox_with_tests
+        children = []
+        real_popen = subprocess.Popen
+
+        def popen(cmd, **kwargs):
+            script = "import os, time; os.write(1, b'\\xff\\xfe\\n'); time.sleep(30)"
+            children.append(real_popen([sys.executable, "-c", script], **kwargs))
+            return children[-1]
+
+        monkeypatch.setattr(tester_module.subprocess, "Popen", popen)
+        result = runner.run_tests("test_passing.py")
+        assert result.success is False
+        assert children[0].poll() is not None  # Killed and reaped
+        print(f"  ✅ Child killed after a read error: {result.error}")
+
+    def test_timeout_kills_run(self, sandbox_with_tests):
+        runner, sandbox_dir = sandbox_with_tests
+        (sandbox_dir / "test_slow.py").write_text("import time\n\ndef test_slow():\n    time.sleep(30)\n")
+        runner = PytestRunner(runner._sandbox, timeout=2)
+        result = runner.run_tests("test_slow.py")
+        assert result.success is False
+        assert "timeout" in result.error
+        print(f"  ✅ Timeout handled: {result.error}")
+
+    def test_check_tests_exist(self, sandbox_with_tests):
+        runner, sandbox_dir = sandbox_with_tests
+        (sandbox_dir / "pkg" / "deep").mkdir(parents=True)
+        (sandbox_dir / "pkg" / "deep" / "test_inner.py").write_text("")
+        (sandbox_dir / "lib").mkdir()
+        (sandbox_dir / "lib" / "helpers.py").write_text("")
+        assert runner.check_tests_exist("test_passing.py") is True
+        assert runner.check_tests_exist("good_module.py") is False
+        assert runner.check_tests_exist("pkg") is True
+        assert runner.check_tests_exist("lib") is False
+        print("  ✅ check_tests_exist for files and directories")
+
     def test_empty_test_file(self, sandbox_with_tests):
         runner, _ = sandbox_with_tests
         result = runner.run_tests("test_empty.py")
@@ -132,4 +256,5 @@ class TestTestResult:
         d = result.to_dict()
         assert d["all_tests_passed"] is False
         assert len(d["failed_tests"]) == 1
+        assert not hasattr(result, "__dict__") and not hasattr(result.failed_tests[0], "__dict__")
         print(f"  ✅ to_dict: passed={d['stats']['passed']}, failed={d['stats']['failed']}")